@@ -7,6 +7,12 @@ interface DataStatsProps {
   stats: any;
 }
 
+// Static chart config lives at module scope so it is not rebuilt on every render
+const COLORS = ['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6', '#EC4899'];
+
+const formatPieLabel = ({ name, percent }: { name: string; percent: number }) =>
+  `${name} ${(percent * 100).toFixed(0)}%`;
+
 export default function DataStats({ stats }: DataStatsProps) {
   if (!stats) {
     return (
@@ -22,7 +28,16 @@ export default function DataStats({ stats }: DataStatsProps) {
     value: count as number,
   }));
 
-  const COLORS = ['#3B82F6', '#10B981', '#F59E0B', '#EF4444', '#8B5CF6', '#EC4899'];
+  const structuredRecordsData = stats.structuredRecords
+    ? [
+        { name: 'Companies', value: stats.structuredRecords.companies || 0 },
+        { name: 'Transactions', value: Math.min(stats.structuredRecords.transactions || 0, 1000) },
+        { name: 'Customers', value: stats.structuredRecords.customers || 0 },
+      ]
+    : null;
+
+  const embeddingsPerFile = (stats.vectorEmbeddings || 0) / Math.max(stats.totalFiles || 1, 1);
+  const completeness = stats.dataQuality?.completeness || 0;
 
   const overviewData = [
     {
@@ -83,7 +98,7 @@ export default function DataStats({ stats }: DataStatsProps) {
                   cx="50%"
                   cy="50%"
                   labelLine={false}
-                  label={({ name, percent }) => `${name} ${(percent * 100).toFixed(0)}%`}
+                  label={formatPieLabel}
                   outerRadius={80}
                   fill="#8884d8"
                   dataKey="value"
@@ -99,17 +114,11 @@ export default function DataStats({ stats }: DataStatsProps) {
         )}
 
         {/* Structured Records Bar Chart */}
-        {stats.structuredRecords && (
+        {structuredRecordsData && (
           <div className="bg-white border border-gray-200 rounded-lg p-6">
             <h3 className="text-lg font-semibold mb-4">Structured Records</h3>
             <ResponsiveContainer width="100%" height={300}>
-              <BarChart
-                data={[
-                  { name: 'Companies', value: stats.structuredRecords.companies || 0 },
-                  { name: 'Transactions', value: Math.min(stats.structuredRecords.transactions || 0, 1000) },
-                  { name: 'Customers', value: stats.structuredRecords.customers || 0 },
-                ]}
-              >
+              <BarChart data={structuredRecordsData}>
                 <CartesianGrid strokeDasharray="3 3" />
                 <XAxis dataKey="name" />
                 <YAxis />
@@ -131,15 +140,12 @@ export default function DataStats({ stats }: DataStatsProps) {
               <div
                 className="bg-green-600 h-2 rounded-full"
                 style={{
-                  width: `${Math.min(
-                    ((stats.vectorEmbeddings || 0) / Math.max(stats.totalFiles || 1, 1)) * 10,
-                    100
-                  )}%`,
+                  width: `${Math.min(embeddingsPerFile * 10, 100)}%`,
                 }}
               />
             </div>
             <p className="text-xs text-gray-500 mt-1">
-              {((stats.vectorEmbeddings || 0) / Math.max(stats.totalFiles || 1, 1)).toFixed(1)} embeddings per file
+              {embeddingsPerFile.toFixed(1)} embeddings per file
             </p>
           </div>
 
@@ -149,12 +155,12 @@ export default function DataStats({ stats }: DataStatsProps) {
               <div
                 className="bg-blue-600 h-2 rounded-full"
                 style={{
-                  width: `${Math.min(Object.keys(stats.documentTypes || {}).length * 20, 100)}%`,
+                  width: `${Math.min(documentTypesData.length * 20, 100)}%`,
                 }}
               />
             </div>
             <p className="text-xs text-gray-500 mt-1">
-              {Object.keys(stats.documentTypes || {}).length} different types
+              {documentTypesData.length} different types
             </p>
           </div>
 
@@ -164,14 +170,14 @@ export default function DataStats({ stats }: DataStatsProps) {
               <div
                 className="bg-purple-600 h-2 rounded-full"
                 style={{
-                  width: `${
-                    stats.totalFiles > 0 ? 85 : 0
-                  }%`,
+                  width: `${Math.min(completeness, 100)}%`,
                 }}
               />
             </div>
             <p className="text-xs text-gray-500 mt-1">
-              {stats.totalFiles > 0 ? 'Good coverage' : 'No data'}
+              {stats.dataQuality?.datasets > 0
+                ? `${completeness.toFixed(1)}% complete rows across ${stats.dataQuality.datasets} dataset(s)`
+                : 'No structured data'}
             </p>
           </div>
         </div>
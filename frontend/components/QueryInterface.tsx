@@ -1,8 +1,9 @@
 'use client';
 
-import { useState } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { Send, Loader2, Sparkles } from 'lucide-react';
 import axios from 'axios';
+import { getSocket } from '@/lib/socket';
 
 interface QueryResult {
   answer: string;
@@ -19,6 +20,23 @@ export default function QueryInterface() {
   const [isLoading, setIsLoading] = useState(false);
   const [result, setResult] = useState<QueryResult | null>(null);
   const [error, setError] = useState<string | null>(null);
+  const [streamingAnswer, setStreamingAnswer] = useState('');
+  const activeRequestId = useRef<string | null>(null);
+
+  // Show the answer as it streams in (tokens arrive over the socket while the POST is pending)
+  useEffect(() => {
+    const socket = getSocket();
+    const handleToken = ({ requestId, token }: { requestId: string; token: string }) => {
+      if (requestId === activeRequestId.current) {
+        setStreamingAnswer(prev => prev + token);
+      }
+    };
+
+    socket.on('query:token', handleToken);
+    return () => {
+      socket.off('query:token', handleToken);
+    };
+  }, []);
 
   const sampleQueries = [
     "What is the life expectancy in Afghanistan?",
@@ -35,10 +53,18 @@ export default function QueryInterface() {
     setIsLoading(true);
     setError(null);
     setResult(null);
+    setStreamingAnswer('');
 
     try {
+      // crypto.randomUUID is only available in secure contexts, so build the id by hand
+      const requestId = `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`;
+      activeRequestId.current = requestId;
+
+      // Tokens are streamed back only to this client's socket
+      const socketId = getSocket().id;
+
       // Set 5-minute timeout for long-running agent queries
-      const response = await axios.post('/api/query', { query }, {
+      const response = await axios.post('/api/query', { query, requestId, socketId }, {
         timeout: 300000, // 5 minutes for GPT-5 + tool calling
       });
       setResult(response.data);
@@ -46,6 +72,8 @@ export default function QueryInterface() {
       setError('Failed to process query. Please try again.');
       console.error('Query error:', err);
     } finally {
+      activeRequestId.current = null;
+      setStreamingAnswer('');
       setIsLoading(false);
     }
   };
@@ -98,8 +126,23 @@ export default function QueryInterface() {
         </div>
       </form>
 
+      {/* Streaming Answer */}
+      {isLoading && streamingAnswer && (
+        <div className="bg-white border border-gray-200 rounded-lg p-6">
+          <div className="flex items-start space-x-3">
+            <Loader2 className="animate-spin text-primary-600 mt-1" size={20} />
+            <div className="flex-1">
+              <h3 className="font-semibold text-gray-900 mb-2">Answer</h3>
+              <div className="prose prose-sm max-w-none text-gray-700 whitespace-pre-wrap">
+                {streamingAnswer}
+              </div>
+            </div>
+          </div>
+        </div>
+      )}
+
       {/* Loading State */}
-      {isLoading && (
+      {isLoading && !streamingAnswer && (
         <div className="flex items-center justify-center py-8">
           <div className="text-center space-y-3">
             <Sparkles className="animate-pulse mx-auto text-primary-600" size={32} />
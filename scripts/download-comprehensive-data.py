@@ -3,12 +3,58 @@ Download comprehensive real financial data from Yahoo Finance
 Creates multiple CSV files for different sectors and analysis types
 """
 
+import os
+import sys
 import yfinance as yf
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+
+# Pass --parquet to also write a Snappy-compressed Parquet copy next to each CSV.
+# CSV stays the primary output because the ingestion pipeline only reads CSV/Excel.
+WRITE_PARQUET = '--parquet' in sys.argv
+
+
+def save_dataset(df, csv_path):
+    """Write the dataset as CSV, plus Parquet when requested"""
+    df.to_csv(csv_path, index=False, date_format='%Y-%m-%d')
+    if WRITE_PARQUET:
+        parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+        df.to_parquet(parquet_path, engine='pyarrow', compression='snappy', index=False)
+        print(f"🗜️  Parquet copy: {parquet_path}")
+
+
+def statement_rows(statement, dates, rows):
+    """Select line items for the given quarter dates as columns (one row per quarter).
+
+    Missing line items become NaN instead of per-cell lookups.
+    """
+    frame = statement.reindex(index=list(rows), columns=dates).T
+    return frame.rename(columns=rows).astype(float)
+
+
+def to_int(values):
+    """Truncate to whole numbers, keeping missing values as nullable integers"""
+    return np.trunc(values).astype('Int64')
+
+
+def margin(numerator, denominator):
+    """Ratio of two columns, missing where either side is zero (matches the old truthiness check)"""
+    return (numerator / denominator).where((numerator != 0) & (denominator != 0))
+
+
+def period_columns(dates):
+    """Quarter/Year/Date label columns for a set of statement dates (vectorized over the index)"""
+    return {
+        'Quarter': 'Q' + dates.quarter.astype(str),
+        'Year': dates.year,
+        'Date': dates,  # kept as datetime64; formatted only when written to CSV
+    }
+
+
 print("📊 Downloading comprehensive real financial data from Yahoo Finance...")
 print("=" * 80)
 
@@ -27,51 +73,45 @@ tech_companies = {
     'AMD': 'Advanced Micro Devices'
 }
 
-tech_data = []
+tech_frames = []
 for ticker, name in tech_companies.items():
     try:
         stock = yf.Ticker(ticker)
         income = stock.quarterly_income_stmt
-        balance = stock.quarterly_balance_sheet
-        cashflow = stock.quarterly_cashflow
 
         if income is None or income.empty:
             continue
 
-        for col in income.columns[:6]:  # Last 6 quarters
-            try:
-                quarter_date = col
-                revenue = income.loc['Total Revenue', col] if 'Total Revenue' in income.index else None
-                gross_profit = income.loc['Gross Profit', col] if 'Gross Profit' in income.index else None
-                operating_income = income.loc['Operating Income', col] if 'Operating Income' in income.index else None
-                net_income = income.loc['Net Income', col] if 'Net Income' in income.index else None
-
-                rd_expense = income.loc['Research And Development', col] if 'Research And Development' in income.index else None
-
-                tech_data.append({
-                    'Company': name,
-                    'Ticker': ticker,
-                    'Quarter': f"Q{(quarter_date.month - 1) // 3 + 1}",
-                    'Year': quarter_date.year,
-                    'Date': quarter_date.strftime('%Y-%m-%d'),
-                    'Revenue': int(revenue) if pd.notna(revenue) else None,
-                    'Gross_Profit': int(gross_profit) if pd.notna(gross_profit) else None,
-                    'Operating_Income': int(operating_income) if pd.notna(operating_income) else None,
-                    'Net_Income': int(net_income) if pd.notna(net_income) else None,
-                    'RD_Expense': int(rd_expense) if pd.notna(rd_expense) else None,
-                    'Gross_Margin': float(gross_profit / revenue) if revenue and gross_profit else None,
-                    'Operating_Margin': float(operating_income / revenue) if revenue and operating_income else None,
-                    'Net_Margin': float(net_income / revenue) if revenue and net_income else None,
-                    'RD_Intensity': float(rd_expense / revenue) if revenue and rd_expense else None,
-                })
-            except Exception as e:
-                continue
+        # Last 6 quarters, extracted as whole columns rather than cell by cell
+        dates = pd.DatetimeIndex(income.columns[:6])
+        metrics = statement_rows(income, dates, {
+            'Total Revenue': 'Revenue',
+            'Gross Profit': 'Gross_Profit',
+            'Operating Income': 'Operating_Income',
+            'Net Income': 'Net_Income',
+            'Research And Development': 'RD_Expense',
+        })
+
+        tech_frames.append(pd.DataFrame({
+            'Company': name,
+            'Ticker': ticker,
+            **period_columns(dates),
+            'Revenue': to_int(metrics['Revenue']),
+            'Gross_Profit': to_int(metrics['Gross_Profit']),
+            'Operating_Income': to_int(metrics['Operating_Income']),
+            'Net_Income': to_int(metrics['Net_Income']),
+            'RD_Expense': to_int(metrics['RD_Expense']),
+            'Gross_Margin': margin(metrics['Gross_Profit'], metrics['Revenue']),
+            'Operating_Margin': margin(metrics['Operating_Income'], metrics['Revenue']),
+            'Net_Margin': margin(metrics['Net_Income'], metrics['Revenue']),
+            'RD_Intensity': margin(metrics['RD_Expense'], metrics['Revenue']),
+        }, index=dates).reset_index(drop=True))
         print(f"  ✅ {ticker} - {name}")
     except Exception as e:
         print(f"  ❌ {ticker} - Error: {e}")
 
-df_tech = pd.DataFrame(tech_data)
-df_tech.to_csv('data/demo/tech-sector-financials.csv', index=False)
+df_tech = pd.concat(tech_frames, ignore_index=True) if tech_frames else pd.DataFrame()
+save_dataset(df_tech, 'data/demo/tech-sector-financials.csv')
 print(f"💾 Saved tech-sector-financials.csv ({len(df_tech)} records)")
 
 # 2. HEALTHCARE SECTOR
@@ -87,7 +127,7 @@ healthcare_companies = {
     'LLY': 'Eli Lilly'
 }
 
-healthcare_data = []
+healthcare_frames = []
 for ticker, name in healthcare_companies.items():
     try:
         stock = yf.Ticker(ticker)
@@ -96,35 +136,32 @@ for ticker, name in healthcare_companies.items():
         if income is None or income.empty:
             continue
 
-        for col in income.columns[:6]:
-            try:
-                quarter_date = col
-                revenue = income.loc['Total Revenue', col] if 'Total Revenue' in income.index else None
-                gross_profit = income.loc['Gross Profit', col] if 'Gross Profit' in income.index else None
-                net_income = income.loc['Net Income', col] if 'Net Income' in income.index else None
-                rd_expense = income.loc['Research And Development', col] if 'Research And Development' in income.index else None
-
-                healthcare_data.append({
-                    'Company': name,
-                    'Ticker': ticker,
-                    'Quarter': f"Q{(quarter_date.month - 1) // 3 + 1}",
-                    'Year': quarter_date.year,
-                    'Date': quarter_date.strftime('%Y-%m-%d'),
-                    'Revenue': int(revenue) if pd.notna(revenue) else None,
-                    'Gross_Profit': int(gross_profit) if pd.notna(gross_profit) else None,
-                    'Net_Income': int(net_income) if pd.notna(net_income) else None,
-                    'RD_Expense': int(rd_expense) if pd.notna(rd_expense) else None,
-                    'Gross_Margin': float(gross_profit / revenue) if revenue and gross_profit else None,
-                    'Net_Margin': float(net_income / revenue) if revenue and net_income else None,
-                })
-            except Exception as e:
-                continue
+        # Last 6 quarters, extracted as whole columns rather than cell by cell
+        dates = pd.DatetimeIndex(income.columns[:6])
+        metrics = statement_rows(income, dates, {
+            'Total Revenue': 'Revenue',
+            'Gross Profit': 'Gross_Profit',
+            'Net Income': 'Net_Income',
+            'Research And Development': 'RD_Expense',
+        })
+
+        healthcare_frames.append(pd.DataFrame({
+            'Company': name,
+            'Ticker': ticker,
+            **period_columns(dates),
+            'Revenue': to_int(metrics['Revenue']),
+            'Gross_Profit': to_int(metrics['Gross_Profit']),
+            'Net_Income': to_int(metrics['Net_Income']),
+            'RD_Expense': to_int(metrics['RD_Expense']),
+            'Gross_Margin': margin(metrics['Gross_Profit'], metrics['Revenue']),
+            'Net_Margin': margin(metrics['Net_Income'], metrics['Revenue']),
+        }, index=dates).reset_index(drop=True))
         print(f"  ✅ {ticker} - {name}")
     except Exception as e:
         print(f"  ❌ {ticker} - Error: {e}")
 
-df_healthcare = pd.DataFrame(healthcare_data)
-df_healthcare.to_csv('data/demo/healthcare-sector-financials.csv', index=False)
+df_healthcare = pd.concat(healthcare_frames, ignore_index=True) if healthcare_frames else pd.DataFrame()
+save_dataset(df_healthcare, 'data/demo/healthcare-sector-financials.csv')
 print(f"💾 Saved healthcare-sector-financials.csv ({len(df_healthcare)} records)")
 
 # 3. FINANCIAL SECTOR
@@ -140,7 +177,7 @@ financial_companies = {
     'AXP': 'American Express'
 }
 
-financial_data = []
+financial_frames = []
 for ticker, name in financial_companies.items():
     try:
         stock = yf.Ticker(ticker)
@@ -149,33 +186,30 @@ for ticker, name in financial_companies.items():
         if income is None or income.empty:
             continue
 
-        for col in income.columns[:6]:
-            try:
-                quarter_date = col
-                revenue = income.loc['Total Revenue', col] if 'Total Revenue' in income.index else None
-                net_income = income.loc['Net Income', col] if 'Net Income' in income.index else None
-                operating_income = income.loc['Operating Income', col] if 'Operating Income' in income.index else None
-
-                financial_data.append({
-                    'Company': name,
-                    'Ticker': ticker,
-                    'Quarter': f"Q{(quarter_date.month - 1) // 3 + 1}",
-                    'Year': quarter_date.year,
-                    'Date': quarter_date.strftime('%Y-%m-%d'),
-                    'Revenue': int(revenue) if pd.notna(revenue) else None,
-                    'Operating_Income': int(operating_income) if pd.notna(operating_income) else None,
-                    'Net_Income': int(net_income) if pd.notna(net_income) else None,
-                    'Operating_Margin': float(operating_income / revenue) if revenue and operating_income else None,
-                    'Net_Margin': float(net_income / revenue) if revenue and net_income else None,
-                })
-            except Exception as e:
-                continue
+        # Last 6 quarters, extracted as whole columns rather than cell by cell
+        dates = pd.DatetimeIndex(income.columns[:6])
+        metrics = statement_rows(income, dates, {
+            'Total Revenue': 'Revenue',
+            'Operating Income': 'Operating_Income',
+            'Net Income': 'Net_Income',
+        })
+
+        financial_frames.append(pd.DataFrame({
+            'Company': name,
+            'Ticker': ticker,
+            **period_columns(dates),
+            'Revenue': to_int(metrics['Revenue']),
+            'Operating_Income': to_int(metrics['Operating_Income']),
+            'Net_Income': to_int(metrics['Net_Income']),
+            'Operating_Margin': margin(metrics['Operating_Income'], metrics['Revenue']),
+            'Net_Margin': margin(metrics['Net_Income'], metrics['Revenue']),
+        }, index=dates).reset_index(drop=True))
         print(f"  ✅ {ticker} - {name}")
     except Exception as e:
         print(f"  ❌ {ticker} - Error: {e}")
 
-df_financial = pd.DataFrame(financial_data)
-df_financial.to_csv('data/demo/financial-sector.csv', index=False)
+df_financial = pd.concat(financial_frames, ignore_index=True) if financial_frames else pd.DataFrame()
+save_dataset(df_financial, 'data/demo/financial-sector.csv')
 print(f"💾 Saved financial-sector.csv ({len(df_financial)} records)")
 
 # 4. CONSUMER / RETAIL SECTOR
@@ -191,7 +225,7 @@ consumer_companies = {
     'COST': 'Costco Wholesale'
 }
 
-consumer_data = []
+consumer_frames = []
 for ticker, name in consumer_companies.items():
     try:
         stock = yf.Ticker(ticker)
@@ -200,36 +234,33 @@ for ticker, name in consumer_companies.items():
         if income is None or income.empty:
             continue
 
-        for col in income.columns[:6]:
-            try:
-                quarter_date = col
-                revenue = income.loc['Total Revenue', col] if 'Total Revenue' in income.index else None
-                gross_profit = income.loc['Gross Profit', col] if 'Gross Profit' in income.index else None
-                operating_income = income.loc['Operating Income', col] if 'Operating Income' in income.index else None
-                net_income = income.loc['Net Income', col] if 'Net Income' in income.index else None
-
-                consumer_data.append({
-                    'Company': name,
-                    'Ticker': ticker,
-                    'Quarter': f"Q{(quarter_date.month - 1) // 3 + 1}",
-                    'Year': quarter_date.year,
-                    'Date': quarter_date.strftime('%Y-%m-%d'),
-                    'Revenue': int(revenue) if pd.notna(revenue) else None,
-                    'Gross_Profit': int(gross_profit) if pd.notna(gross_profit) else None,
-                    'Operating_Income': int(operating_income) if pd.notna(operating_income) else None,
-                    'Net_Income': int(net_income) if pd.notna(net_income) else None,
-                    'Gross_Margin': float(gross_profit / revenue) if revenue and gross_profit else None,
-                    'Operating_Margin': float(operating_income / revenue) if revenue and operating_income else None,
-                    'Net_Margin': float(net_income / revenue) if revenue and net_income else None,
-                })
-            except Exception as e:
-                continue
+        # Last 6 quarters, extracted as whole columns rather than cell by cell
+        dates = pd.DatetimeIndex(income.columns[:6])
+        metrics = statement_rows(income, dates, {
+            'Total Revenue': 'Revenue',
+            'Gross Profit': 'Gross_Profit',
+            'Operating Income': 'Operating_Income',
+            'Net Income': 'Net_Income',
+        })
+
+        consumer_frames.append(pd.DataFrame({
+            'Company': name,
+            'Ticker': ticker,
+            **period_columns(dates),
+            'Revenue': to_int(metrics['Revenue']),
+            'Gross_Profit': to_int(metrics['Gross_Profit']),
+            'Operating_Income': to_int(metrics['Operating_Income']),
+            'Net_Income': to_int(metrics['Net_Income']),
+            'Gross_Margin': margin(metrics['Gross_Profit'], metrics['Revenue']),
+            'Operating_Margin': margin(metrics['Operating_Income'], metrics['Revenue']),
+            'Net_Margin': margin(metrics['Net_Income'], metrics['Revenue']),
+        }, index=dates).reset_index(drop=True))
         print(f"  ✅ {ticker} - {name}")
     except Exception as e:
         print(f"  ❌ {ticker} - Error: {e}")
 
-df_consumer = pd.DataFrame(consumer_data)
-df_consumer.to_csv('data/demo/consumer-retail-financials.csv', index=False)
+df_consumer = pd.concat(consumer_frames, ignore_index=True) if consumer_frames else pd.DataFrame()
+save_dataset(df_consumer, 'data/demo/consumer-retail-financials.csv')
 print(f"💾 Saved consumer-retail-financials.csv ({len(df_consumer)} records)")
 
 # 5. ENERGY SECTOR
@@ -242,7 +273,7 @@ energy_companies = {
     'EOG': 'EOG Resources'
 }
 
-energy_data = []
+energy_frames = []
 for ticker, name in energy_companies.items():
     try:
         stock = yf.Ticker(ticker)
@@ -251,33 +282,30 @@ for ticker, name in energy_companies.items():
         if income is None or income.empty:
             continue
 
-        for col in income.columns[:6]:
-            try:
-                quarter_date = col
-                revenue = income.loc['Total Revenue', col] if 'Total Revenue' in income.index else None
-                gross_profit = income.loc['Gross Profit', col] if 'Gross Profit' in income.index else None
-                net_income = income.loc['Net Income', col] if 'Net Income' in income.index else None
-
-                energy_data.append({
-                    'Company': name,
-                    'Ticker': ticker,
-                    'Quarter': f"Q{(quarter_date.month - 1) // 3 + 1}",
-                    'Year': quarter_date.year,
-                    'Date': quarter_date.strftime('%Y-%m-%d'),
-                    'Revenue': int(revenue) if pd.notna(revenue) else None,
-                    'Gross_Profit': int(gross_profit) if pd.notna(gross_profit) else None,
-                    'Net_Income': int(net_income) if pd.notna(net_income) else None,
-                    'Gross_Margin': float(gross_profit / revenue) if revenue and gross_profit else None,
-                    'Net_Margin': float(net_income / revenue) if revenue and net_income else None,
-                })
-            except Exception as e:
-                continue
+        # Last 6 quarters, extracted as whole columns rather than cell by cell
+        dates = pd.DatetimeIndex(income.columns[:6])
+        metrics = statement_rows(income, dates, {
+            'Total Revenue': 'Revenue',
+            'Gross Profit': 'Gross_Profit',
+            'Net Income': 'Net_Income',
+        })
+
+        energy_frames.append(pd.DataFrame({
+            'Company': name,
+            'Ticker': ticker,
+            **period_columns(dates),
+            'Revenue': to_int(metrics['Revenue']),
+            'Gross_Profit': to_int(metrics['Gross_Profit']),
+            'Net_Income': to_int(metrics['Net_Income']),
+            'Gross_Margin': margin(metrics['Gross_Profit'], metrics['Revenue']),
+            'Net_Margin': margin(metrics['Net_Income'], metrics['Revenue']),
+        }, index=dates).reset_index(drop=True))
         print(f"  ✅ {ticker} - {name}")
     except Exception as e:
         print(f"  ❌ {ticker} - Error: {e}")
 
-df_energy = pd.DataFrame(energy_data)
-df_energy.to_csv('data/demo/energy-sector-financials.csv', index=False)
+df_energy = pd.concat(energy_frames, ignore_index=True) if energy_frames else pd.DataFrame()
+save_dataset(df_energy, 'data/demo/energy-sector-financials.csv')
 print(f"💾 Saved energy-sector-financials.csv ({len(df_energy)} records)")
 
 # Summary
@@ -3,10 +3,27 @@ Download real quarterly financial data from Yahoo Finance
 Creates a comprehensive CSV with multiple companies and metrics
 """
 
+import os
+import sys
 import yfinance as yf
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+
+# Pass --parquet to also write a Snappy-compressed Parquet copy next to each CSV.
+# CSV stays the primary output because the ingestion pipeline only reads CSV/Excel.
+WRITE_PARQUET = '--parquet' in sys.argv
+
+
+def save_dataset(df, csv_path):
+    """Write the dataset as CSV, plus Parquet when requested"""
+    df.to_csv(csv_path, index=False, date_format='%Y-%m-%d')
+    if WRITE_PARQUET:
+        parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+        df.to_parquet(parquet_path, engine='pyarrow', compression='snappy', index=False)
+        print(f"🗜️  Parquet copy: {parquet_path}")
+
 # S&P500 companies from different sectors
 companies = {
     'AAPL': 'Apple Inc',
@@ -25,7 +42,28 @@ print("📊 Downloading REAL quarterly financial data from Yahoo Finance...")
 print(f"Companies: {len(companies)}")
 print("=" * 80)
 
-all_data = []
+def statement_rows(statement, dates, rows):
+    """Select line items for the given quarter dates as columns (one row per quarter).
+
+    Missing statements, line items or dates become NaN instead of per-cell lookups.
+    """
+    if statement is None or statement.empty:
+        return pd.DataFrame(index=dates, columns=list(rows.values()), dtype=float)
+    frame = statement.reindex(index=list(rows), columns=dates).T
+    return frame.rename(columns=rows).astype(float)
+
+
+def to_int(values):
+    """Truncate to whole numbers, keeping missing values as nullable integers"""
+    return np.trunc(values).astype('Int64')
+
+
+def margin(numerator, denominator):
+    """Ratio of two columns, missing where either side is zero (matches the old truthiness check)"""
+    return (numerator / denominator).where((numerator != 0) & (denominator != 0))
+
+
+frames = []
 
 for ticker, company_name in companies.items():
     print(f"\n📈 Fetching {ticker} - {company_name}...")
@@ -42,89 +80,72 @@ for ticker, company_name in companies.items():
             print(f"  ⚠️  No data available for {ticker}")
             continue
 
-        # Process each quarter
-        for col in quarterly_income.columns[:8]:  # Last 8 quarters (~2 years)
-            try:
-                quarter_date = col
-                year = quarter_date.year
-                quarter = f"Q{(quarter_date.month - 1) // 3 + 1}"
-
-                # Extract key metrics (handle missing data gracefully)
-                revenue = quarterly_income.loc['Total Revenue', col] if 'Total Revenue' in quarterly_income.index else None
-                gross_profit = quarterly_income.loc['Gross Profit', col] if 'Gross Profit' in quarterly_income.index else None
-                operating_income = quarterly_income.loc['Operating Income', col] if 'Operating Income' in quarterly_income.index else None
-                net_income = quarterly_income.loc['Net Income', col] if 'Net Income' in quarterly_income.index else None
-
-                # EBITDA calculation (if available)
-                ebitda = None
-                if 'EBITDA' in quarterly_income.index:
-                    ebitda = quarterly_income.loc['EBITDA', col]
-                elif operating_income is not None:
-                    # Approximate EBITDA
-                    ebitda = operating_income
-
-                # Balance sheet metrics
-                total_assets = quarterly_balance.loc['Total Assets', col] if quarterly_balance is not None and 'Total Assets' in quarterly_balance.index else None
-                total_debt = quarterly_balance.loc['Total Debt', col] if quarterly_balance is not None and 'Total Debt' in quarterly_balance.index else None
-
-                # Cash flow metrics
-                operating_cashflow = quarterly_cashflow.loc['Operating Cash Flow', col] if quarterly_cashflow is not None and 'Operating Cash Flow' in quarterly_cashflow.index else None
-                free_cashflow = quarterly_cashflow.loc['Free Cash Flow', col] if quarterly_cashflow is not None and 'Free Cash Flow' in quarterly_cashflow.index else None
-
-                # Calculate margins
-                gross_margin = (gross_profit / revenue) if revenue and gross_profit else None
-                operating_margin = (operating_income / revenue) if revenue and operating_income else None
-                net_margin = (net_income / revenue) if revenue and net_income else None
-
-                row = {
-                    'Company': company_name,
-                    'Ticker': ticker,
-                    'Quarter': quarter,
-                    'Year': year,
-                    'Date': quarter_date.strftime('%Y-%m-%d'),
-                    'Revenue': int(revenue) if pd.notna(revenue) else None,
-                    'Gross_Profit': int(gross_profit) if pd.notna(gross_profit) else None,
-                    'EBITDA': int(ebitda) if pd.notna(ebitda) else None,
-                    'Operating_Income': int(operating_income) if pd.notna(operating_income) else None,
-                    'Net_Income': int(net_income) if pd.notna(net_income) else None,
-                    'Total_Assets': int(total_assets) if pd.notna(total_assets) else None,
-                    'Total_Debt': int(total_debt) if pd.notna(total_debt) else None,
-                    'Operating_Cashflow': int(operating_cashflow) if pd.notna(operating_cashflow) else None,
-                    'Free_Cashflow': int(free_cashflow) if pd.notna(free_cashflow) else None,
-                    'Gross_Margin': float(gross_margin) if pd.notna(gross_margin) else None,
-                    'Operating_Margin': float(operating_margin) if pd.notna(operating_margin) else None,
-                    'Net_Margin': float(net_margin) if pd.notna(net_margin) else None,
-                }
-
-                all_data.append(row)
-                print(f"  ✅ {quarter} {year}: Revenue ${revenue/1e9:.2f}B" if revenue else f"  ⚠️  {quarter} {year}: Missing data")
-
-            except Exception as e:
-                print(f"  ❌ Error processing quarter {col}: {e}")
-                continue
+        # Last 8 quarters (~2 years), extracted as whole columns rather than cell by cell
+        dates = pd.DatetimeIndex(quarterly_income.columns[:8])
+        income = statement_rows(quarterly_income, dates, {
+            'Total Revenue': 'Revenue',
+            'Gross Profit': 'Gross_Profit',
+            'Operating Income': 'Operating_Income',
+            'Net Income': 'Net_Income',
+            'EBITDA': 'EBITDA',
+        })
+        balance = statement_rows(quarterly_balance, dates, {
+            'Total Assets': 'Total_Assets',
+            'Total Debt': 'Total_Debt',
+        })
+        cashflow = statement_rows(quarterly_cashflow, dates, {
+            'Operating Cash Flow': 'Operating_Cashflow',
+            'Free Cash Flow': 'Free_Cashflow',
+        })
+
+        # EBITDA if reported, otherwise approximate with operating income
+        ebitda = income['EBITDA'] if 'EBITDA' in quarterly_income.index else income['Operating_Income']
+
+        df_company = pd.DataFrame({
+            'Company': company_name,
+            'Ticker': ticker,
+            'Quarter': 'Q' + dates.quarter.astype(str),
+            'Year': dates.year,
+            'Date': dates,  # kept as datetime64; formatted only when written to CSV
+            'Revenue': to_int(income['Revenue']),
+            'Gross_Profit': to_int(income['Gross_Profit']),
+            'EBITDA': to_int(ebitda),
+            'Operating_Income': to_int(income['Operating_Income']),
+            'Net_Income': to_int(income['Net_Income']),
+            'Total_Assets': to_int(balance['Total_Assets']),
+            'Total_Debt': to_int(balance['Total_Debt']),
+            'Operating_Cashflow': to_int(cashflow['Operating_Cashflow']),
+            'Free_Cashflow': to_int(cashflow['Free_Cashflow']),
+            'Gross_Margin': margin(income['Gross_Profit'], income['Revenue']),
+            'Operating_Margin': margin(income['Operating_Income'], income['Revenue']),
+            'Net_Margin': margin(income['Net_Income'], income['Revenue']),
+        }, index=dates).reset_index(drop=True)
+
+        frames.append(df_company)
+        for quarter, year, revenue in zip(df_company['Quarter'], df_company['Year'], df_company['Revenue']):
+            print(f"  ✅ {quarter} {year}: Revenue ${revenue/1e9:.2f}B" if pd.notna(revenue) else f"  ⚠️  {quarter} {year}: Missing data")
 
     except Exception as e:
         print(f"  ❌ Error fetching {ticker}: {e}")
         continue
 
 print("\n" + "=" * 80)
-print(f"✅ Downloaded {len(all_data)} quarterly records")
-
-# Create DataFrame
-df = pd.DataFrame(all_data)
+# Create DataFrame (one concat instead of building row dicts)
+df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+print(f"✅ Downloaded {len(df)} quarterly records")
 
 # Sort by company and date
 df = df.sort_values(['Company', 'Year', 'Quarter'])
 
-# Save to CSV
+# Save to CSV (and Parquet with --parquet)
 output_path = 'test-data/real-sp500-financials.csv'
-df.to_csv(output_path, index=False)
+save_dataset(df, output_path)
 
 print(f"💾 Saved to: {output_path}")
 print(f"\n📊 Dataset Summary:")
 print(f"   Companies: {df['Company'].nunique()}")
 print(f"   Records: {len(df)}")
-print(f"   Date range: {df['Date'].min()} to {df['Date'].max()}")
+print(f"   Date range: {df['Date'].min():%Y-%m-%d} to {df['Date'].max():%Y-%m-%d}")
 print(f"   Columns: {len(df.columns)}")
 print(f"\n📉 Data Quality:")
 print(f"   Completeness: {(1 - df.isnull().sum().sum() / (len(df) * len(df.columns))) * 100:.1f}%")
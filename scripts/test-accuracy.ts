@@ -4,6 +4,7 @@
  */
 
 import * as fs from 'fs';
+import * as http from 'http';
 import * as path from 'path';
 
 interface TestCase {
@@ -26,10 +27,33 @@ interface QueryResponse {
   responseTime: number;
 }
 
-// Helper to query the API using node-fetch or http
+// Keep-alive agent so every test query reuses one TCP connection
+const keepAliveAgent = new http.Agent({ keepAlive: true, maxSockets: 1 });
+
+// Transient gateway errors are retried with exponential backoff (0.3s, 0.6s, 1.2s)
+const RETRY_STATUSES = new Set([502, 503, 504]);
+const MAX_RETRIES = 3;
+const BACKOFF_MS = 300;
+
+class RetryableError extends Error {}
+
+// Helper to query the API, retrying transient failures
 async function queryAPI(query: string): Promise<QueryResponse> {
-  const http = await import('http');
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await postQuery(query);
+    } catch (error) {
+      if (!(error instanceof RetryableError) || attempt >= MAX_RETRIES) throw error;
 
+      const delay = BACKOFF_MS * 2 ** attempt;
+      console.log(`   ↻ ${error.message} - retrying in ${delay}ms (${attempt + 1}/${MAX_RETRIES})`);
+      await new Promise(resolve => setTimeout(resolve, delay));
+    }
+  }
+}
+
+// Single POST to /api/query using http
+function postQuery(query: string): Promise<QueryResponse> {
   return new Promise((resolve, reject) => {
     const data = JSON.stringify({ query });
 
@@ -38,9 +62,10 @@ async function queryAPI(query: string): Promise<QueryResponse> {
       port: 8000,
       path: '/api/query',
       method: 'POST',
+      agent: keepAliveAgent,
       headers: {
         'Content-Type': 'application/json',
-        'Content-Length': data.length
+        'Content-Length': Buffer.byteLength(data)
       }
     };
 
@@ -52,6 +77,10 @@ async function queryAPI(query: string): Promise<QueryResponse> {
       });
 
       res.on('end', () => {
+        if (res.statusCode && RETRY_STATUSES.has(res.statusCode)) {
+          reject(new RetryableError(`HTTP ${res.statusCode}`));
+          return;
+        }
         try {
           resolve(JSON.parse(body));
         } catch (error) {
@@ -60,8 +89,9 @@ async function queryAPI(query: string): Promise<QueryResponse> {
       });
     });
 
-    req.on('error', (error) => {
-      reject(error);
+    req.on('error', (error: NodeJS.ErrnoException) => {
+      // A reused keep-alive socket can be closed by the server between requests
+      reject(error.code === 'ECONNRESET' ? new RetryableError(error.message) : error);
     });
 
     req.write(data);
@@ -467,4 +497,6 @@ async function runTests() {
 }
 
 // Run tests
-runTests().catch(console.error);
+runTests()
+  .catch(console.error)
+  .finally(() => keepAliveAgent.destroy());
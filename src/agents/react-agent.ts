@@ -3,9 +3,16 @@
  * Autonomous agent that uses tools to answer questions
  */
 
+import * as crypto from 'crypto';
 import { StateGraph, Annotation, START, END } from '@langchain/langgraph';
 import OpenAI from 'openai';
-import { BaseMessage, HumanMessage, AIMessage, ToolMessage } from '@langchain/core/messages';
+import {
+  BaseMessage,
+  HumanMessage,
+  AIMessage,
+  ToolMessage,
+  type ToolCall,
+} from '@langchain/core/messages';
 import type { AgentState, AgenticQueryResult, Source } from '../types/agent.types';
 import { agentConfig, REACT_SYSTEM_PROMPT, loggingConfig } from '../config/agent.config';
 import { toolRegistry } from '../tools/tool-registry';
@@ -67,7 +74,7 @@ export class ReactAgent {
   private convertCallId(langchainId: string): string {
     if (!this.callIdMap.has(langchainId)) {
       // Generate a new fc-prefixed ID
-      const fcId = `fc_${Math.random().toString(36).substring(2, 15)}`;
+      const fcId = `fc_${crypto.randomBytes(8).toString('hex')}`;
       this.callIdMap.set(langchainId, fcId);
     }
     return this.callIdMap.get(langchainId)!;
@@ -309,10 +316,12 @@ export class ReactAgent {
       console.log(`\n🔧 Tools Node - Executing ${toolCalls.length} tool(s)`);
     }
 
-    const toolMessages: ToolMessage[] = [];
     let newConsecutiveSearchCalls = state.consecutiveSearchCalls || 0;
 
-    for (const toolCall of toolCalls) {
+    // The anti-loop counter is applied synchronously in call order; allowed calls start
+    // right away and run concurrently - they are independent I/O (vector search,
+    // DuckDB, metadata lookups).
+    const toolMessages: Array<Promise<ToolMessage>> = toolCalls.map(toolCall => {
       if (loggingConfig.traceSteps) {
         console.log(`  ↳ ${toolCall.name}(${JSON.stringify(toolCall.args)})`);
       }
@@ -325,7 +334,8 @@ export class ReactAgent {
 
           console.warn(errorMessage);
 
-          toolMessages.push(
+          // Don't increment further, keep at limit
+          return Promise.resolve(
             new ToolMessage({
               content: JSON.stringify({
                 blocked: true,
@@ -338,9 +348,6 @@ export class ReactAgent {
               name: toolCall.name,
             })
           );
-
-          // Don't increment further, keep at limit
-          continue;
         }
 
         // Increment search counter
@@ -354,41 +361,45 @@ export class ReactAgent {
         newConsecutiveSearchCalls = 0;
       }
 
-      try {
-        // Execute tool via registry
-        const { result, error } = await toolRegistry.execute(toolCall.name, toolCall.args);
+      return this.executeToolCall(toolCall);
+    });
 
-        const content = error || JSON.stringify(result);
+    return {
+      // Results keep the original tool-call order
+      messages: await Promise.all(toolMessages),
+      consecutiveSearchCalls: newConsecutiveSearchCalls,
+    };
+  }
 
-        toolMessages.push(
-          new ToolMessage({
-            content: content,
-            tool_call_id: toolCall.id!,
-            name: toolCall.name,
-          })
-        );
+  /**
+   * Execute a single tool call and wrap the outcome (or failure) in a ToolMessage
+   */
+  private async executeToolCall(toolCall: ToolCall): Promise<ToolMessage> {
+    try {
+      // Execute tool via registry
+      const { result, error } = await toolRegistry.execute(toolCall.name, toolCall.args);
 
-        if (loggingConfig.traceSteps) {
-          const preview = content.substring(0, 150);
-          console.log(`  ✅ Result: ${preview}${content.length > 150 ? '...' : ''}`);
-        }
-      } catch (error: any) {
-        console.error(`❌ Tool ${toolCall.name} failed:`, error);
-
-        toolMessages.push(
-          new ToolMessage({
-            content: `Error: ${error.message}`,
-            tool_call_id: toolCall.id!,
-            name: toolCall.name,
-          })
-        );
+      const content = error || JSON.stringify(result);
+
+      if (loggingConfig.traceSteps) {
+        const preview = content.substring(0, 150);
+        console.log(`  ✅ Result: ${preview}${content.length > 150 ? '...' : ''}`);
       }
-    }
 
-    return {
-      messages: toolMessages,
-      consecutiveSearchCalls: newConsecutiveSearchCalls,
-    };
+      return new ToolMessage({
+        content: content,
+        tool_call_id: toolCall.id!,
+        name: toolCall.name,
+      });
+    } catch (error: any) {
+      console.error(`❌ Tool ${toolCall.name} failed:`, error);
+
+      return new ToolMessage({
+        content: `Error: ${error.message}`,
+        tool_call_id: toolCall.id!,
+        name: toolCall.name,
+      });
+    }
   }
 
   /**
@@ -15,6 +15,8 @@ This is your FIRST STEP for any structured data query. Call this before query_st
 - schema: Array of {name, type} for each column - CRITICAL for accurate SQL
 - description: What data the table contains
 - rowCount: Number of rows in the dataset
+- statistics: Per-column statistical summary (only with includeStatistics: true)
+- insights: Key insights, data gaps and anomalies (only with includeStatistics: true)
 - relevance: How well this dataset matches your query
 
 **Schema usage (CRITICAL):**
@@ -53,12 +55,18 @@ Then in query_structured_data: SELECT Location, "First Tooltip" FROM infant_mort
           description: 'Maximum number of datasets to return (default: 3)',
           default: 3,
         },
+        includeStatistics: {
+          type: 'boolean',
+          description:
+            'Also return per-column statistics and insights (large - only when you need value ranges or data gaps, default: false)',
+          default: false,
+        },
       },
       required: ['query'],
     },
 
     async function(args: Record<string, any>) {
-      const { query, maxResults = 3 } = args;
+      const { query, maxResults = 3, includeStatistics = false } = args;
 
       try {
         console.log(`🔧 Tool: search_dataset_metadata`);
@@ -67,13 +75,8 @@ Then in query_structured_data: SELECT Location, "First Tooltip" FROM infant_mort
         // Search only metadata documents (type: dataset_metadata)
         const results = await vectorSearch.search(query, maxResults);
 
-        // Filter to only metadata documents (description, statistics, or insights)
-        const metadataResults = results.filter(
-          r =>
-            r.metadata?.type === 'csv_description' ||
-            r.metadata?.type === 'csv_statistics' ||
-            r.metadata?.type === 'csv_insights'
-        );
+        // Filter to dataset description documents (statistics/insights are attached below)
+        const metadataResults = results.filter(r => r.metadata?.type === 'csv_description');
 
         if (metadataResults.length === 0) {
           return {
@@ -82,15 +85,31 @@ Then in query_structured_data: SELECT Location, "First Tooltip" FROM infant_mort
           };
         }
 
-        // Format results with schema information
-        const datasets = metadataResults.map(r => ({
-          tableName: r.metadata?.tableId || 'unknown',
-          filename: r.metadata?.filename || 'unknown',
-          description: r.content,
-          schema: r.metadata?.schema || [],
-          rowCount: r.metadata?.rowCount || 0,
-          relevance: r.score !== undefined ? (1 - r.score).toFixed(3) : 'N/A',
-        }));
+        // Format results with schema information. Statistics and insights records (stored
+        // by tableId, not embedded) run to several lines per column, so they are only
+        // attached on request to keep the agent transcript small
+        const datasets = metadataResults.map(r => {
+          const tableId = r.metadata?.tableId;
+          const dataset: Record<string, any> = {
+            tableName: tableId || 'unknown',
+            filename: r.metadata?.filename || 'unknown',
+            description: r.content,
+            schema: r.metadata?.schema || [],
+            rowCount: r.metadata?.rowCount || 0,
+            relevance: r.score !== undefined ? (1 - r.score).toFixed(3) : 'N/A',
+          };
+
+          if (includeStatistics && tableId) {
+            const records = vectorSearch.getRecords({ tableId });
+            // Latest record wins if the file was ingested more than once
+            const latest = (type: string) =>
+              records.filter(rec => rec.metadata.type === type).pop();
+            dataset.statistics = latest('csv_statistics')?.content;
+            dataset.insights = latest('csv_insights')?.content;
+          }
+
+          return dataset;
+        });
 
         console.log(`✅ Found ${datasets.length} matching datasets`);
 
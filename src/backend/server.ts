@@ -201,7 +201,7 @@ app.post('/api/upload', upload.array('files', 10), async (req: Request, res: Res
 // Query endpoint with async RAG
 app.post('/api/query', async (req: Request, res: Response) => {
   try {
-    const { query, filters = {} } = req.body;
+    const { query, filters = {}, requestId, socketId } = req.body;
 
     if (!query) {
       return res.status(400).json({ error: 'Query is required' });
@@ -209,8 +209,16 @@ app.post('/api/query', async (req: Request, res: Response) => {
 
     io.emit('query:start', { query });
 
+    // Stream answer tokens only to the socket that asked - other clients must not see them
+    const onToken =
+      typeof socketId === 'string' && socketId
+        ? (token: string) => {
+            io.to(socketId).emit('query:token', { requestId, token });
+          }
+        : undefined;
+
     // Execute query asynchronously using GPT-5
-    const result = await queryEngine.executeQuery(query, filters);
+    const result = await queryEngine.executeQuery(query, filters, onToken);
 
     io.emit('query:complete', { result });
     res.json(result);
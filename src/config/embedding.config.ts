@@ -0,0 +1,19 @@
+/**
+ * Embedding configuration
+ * Centralized settings for how chunks are sent to the embeddings API
+ */
+
+// OpenAI accepts at most 2048 inputs per embeddings request
+const MAX_BATCH_SIZE = 2048;
+
+export const embeddingConfig = {
+  // Chunks per embeddings request - one HTTP round-trip per batch instead of per chunk
+  // (clamped to at least 1 - a non-positive batch size would never advance the batching loop)
+  batchSize: Math.max(
+    1,
+    Math.min(parseInt(process.env.EMBEDDING_BATCH_SIZE || '512') || 512, MAX_BATCH_SIZE)
+  ),
+
+  // Embeddings requests allowed in flight at once (overlaps network latency)
+  maxConcurrency: Math.max(1, parseInt(process.env.EMBEDDING_MAX_CONCURRENCY || '4') || 4),
+};
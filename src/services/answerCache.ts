@@ -0,0 +1,148 @@
+import { Embeddings } from '@langchain/core/embeddings';
+
+interface AnswerCacheEntry<T> {
+  query: string;
+  embedding: Float32Array;
+  filtersKey: string;
+  entityKey: string;
+  revision: number;
+  createdAt: number;
+  value: T;
+}
+
+/**
+ * Semantic answer cache
+ * Returns a previous answer when a new question embeds within a cosine-similarity threshold
+ * of an earlier one ("summarize risks" vs "summarise the risks"), skipping the LLM round-trip.
+ * Entries are tied to the vector store revision, so ingesting or deleting documents
+ * invalidates every cached answer. A hit also requires the same numbers, quarters and
+ * named entities ("AAPL Q3 2023" never matches "MSFT Q3 2023", however close the embeddings).
+ */
+export class SemanticAnswerCache<T> {
+  private entries: AnswerCacheEntry<T>[] = [];
+
+  private threshold: number;
+  private ttlMs: number;
+  private maxEntries: number;
+
+  constructor(
+    private embeddings: Embeddings,
+    threshold: number = parseFloat(process.env.ANSWER_CACHE_SIMILARITY || '0.95'),
+    ttlMs: number = parseInt(process.env.ANSWER_CACHE_TTL_MS || '86400000'), // 24 hours
+    maxEntries: number = parseInt(process.env.ANSWER_CACHE_MAX_ENTRIES || '500')
+  ) {
+    // Malformed settings fall back to defaults - a NaN threshold would match any question
+    // and a NaN capacity would never evict
+    this.threshold = threshold > 0 && threshold <= 1 ? threshold : 0.95;
+    this.ttlMs = Math.max(1, ttlMs || 86400000);
+    this.maxEntries = Math.max(1, maxEntries || 500);
+  }
+
+  /**
+   * Embed a question (unit-normalized so similarity is a plain dot product)
+   */
+  async embed(query: string): Promise<Float32Array> {
+    const vector = Float32Array.from(await this.embeddings.embedQuery(query));
+    let norm = 0;
+    for (let i = 0; i < vector.length; i++) {
+      norm += vector[i] * vector[i];
+    }
+    norm = Math.sqrt(norm) || 1;
+    for (let i = 0; i < vector.length; i++) {
+      vector[i] /= norm;
+    }
+    return vector;
+  }
+
+  lookup(
+    query: string,
+    embedding: Float32Array,
+    revision: number,
+    filters?: Record<string, any>
+  ): { value: T; similarity: number; query: string } | null {
+    this.purge(revision);
+
+    const filtersKey = JSON.stringify(filters || {});
+    const entityKey = extractEntityKey(query);
+    let best: AnswerCacheEntry<T> | null = null;
+    let bestSimilarity = -1;
+
+    for (const entry of this.entries) {
+      if (
+        entry.filtersKey !== filtersKey ||
+        entry.entityKey !== entityKey ||
+        entry.embedding.length !== embedding.length
+      ) {
+        continue;
+      }
+
+      let similarity = 0;
+      for (let i = 0; i < embedding.length; i++) {
+        similarity += embedding[i] * entry.embedding[i];
+      }
+
+      if (similarity > bestSimilarity) {
+        bestSimilarity = similarity;
+        best = entry;
+      }
+    }
+
+    if (!best || bestSimilarity < this.threshold) {
+      return null;
+    }
+    return { value: best.value, similarity: bestSimilarity, query: best.query };
+  }
+
+  store(
+    query: string,
+    embedding: Float32Array,
+    revision: number,
+    value: T,
+    filters?: Record<string, any>
+  ): void {
+    this.entries.push({
+      query,
+      embedding,
+      filtersKey: JSON.stringify(filters || {}),
+      entityKey: extractEntityKey(query),
+      revision,
+      createdAt: Date.now(),
+      value,
+    });
+
+    // Evict oldest entries beyond capacity
+    if (this.entries.length > this.maxEntries) {
+      this.entries.splice(0, this.entries.length - this.maxEntries);
+    }
+  }
+
+  /**
+   * Drop expired entries and entries answered against an older corpus
+   */
+  private purge(revision: number): void {
+    const cutoff = Date.now() - this.ttlMs;
+    this.entries = this.entries.filter(e => e.revision === revision && e.createdAt >= cutoff);
+  }
+}
+
+/**
+ * Numbers, fiscal periods, tickers and capitalized names in a question, order-independent.
+ * Near-duplicate questions that differ in any of these are asking for different data.
+ */
+function extractEntityKey(query: string): string {
+  const tokens = query.match(/[A-Za-z0-9][A-Za-z0-9&.'-]*/g) || [];
+  const entities = new Set<string>();
+
+  tokens.forEach((raw, index) => {
+    const token = raw.replace(/[.'-]+$/, '');
+    if (
+      /\d/.test(token) || // years, amounts, Q3, FY2023
+      /^[A-Z]{2,}$/.test(token) || // tickers and acronyms
+      (index > 0 && /^[A-Z]/.test(token)) // names (skip the sentence-initial capital)
+    ) {
+      entities.add(token.toLowerCase());
+    }
+  });
+
+  return Array.from(entities).sort().join('|');
+}
@@ -5,8 +5,9 @@ import { DocumentParser, ParsedDocument } from './documentParser';
 import { HierarchicalChunker } from './hierarchicalChunker';
 import { DocumentStore } from './documentStore';
 import type { HierarchicalChunk } from '../types/hierarchical.types';
-import { DuckDBManager } from '../structured-data/duckdb-manager.js';
+import { DuckDBManager, sanitizeTableName } from '../structured-data/duckdb-manager.js';
 import { MetadataGenerator } from '../structured-data/metadata-generator.js';
+import { MetadataCache } from '../structured-data/metadata-cache.js';
 import { parseCSV } from '../structured-data/parsers/csv-parser.js';
 import { ChatOpenAI } from '@langchain/openai';
 
@@ -20,6 +21,41 @@ export interface DataStats {
     transactions: number;
     customers: number;
   };
+  dataQuality: {
+    datasets: number;
+    completeness: number; // row-weighted % of complete rows across structured datasets
+    missingValues: number;
+    duplicateRows: number;
+  };
+}
+
+/**
+ * Coarse dataset category used for the structured record counts
+ */
+export type DatasetKind = 'company' | 'transaction' | 'customer' | 'other';
+
+/**
+ * Per-table quality summary, captured once at ingestion from the dataset profile
+ */
+export interface DatasetQualitySummary {
+  tableName: string;
+  filename: string;
+  kind: DatasetKind;
+  rowCount: number;
+  completeness: number;
+  missingValues: number;
+  duplicateRows: number;
+}
+
+/**
+ * Classify a dataset once from its headers (lower-cased a single time)
+ */
+function classifyDataset(headers: string[]): DatasetKind {
+  const columns = headers.map(header => header.toLowerCase());
+  if (columns.some(col => col.includes('company'))) return 'company';
+  if (columns.some(col => col.includes('transaction'))) return 'transaction';
+  if (columns.some(col => col.includes('customer'))) return 'customer';
+  return 'other';
 }
 
 export class DataProcessor {
@@ -31,6 +67,8 @@ export class DataProcessor {
   private stats: DataStats;
   private duckdb: DuckDBManager;
   private metadataGenerator: MetadataGenerator | null = null;
+  private metadataCache: MetadataCache;
+  private datasetSummaries: Map<string, DatasetQualitySummary> = new Map();
 
   constructor(documentStore?: DocumentStore, vectorSearch?: VectorSearchService) {
     this.documentParser = new DocumentParser();
@@ -40,6 +78,7 @@ export class DataProcessor {
 
     // Initialize structured data support
     this.duckdb = new DuckDBManager();
+    this.metadataCache = new MetadataCache();
 
     // Initialize hierarchical chunker if enabled
     if (this.useHierarchicalChunking && this.documentStore) {
@@ -57,6 +96,12 @@ export class DataProcessor {
         transactions: 0,
         customers: 0,
       },
+      dataQuality: {
+        datasets: 0,
+        completeness: 0,
+        missingValues: 0,
+        duplicateRows: 0,
+      },
     };
   }
 
@@ -81,6 +126,10 @@ export class DataProcessor {
       temperature: 1, // GPT-5 only supports temperature=1 (default)
     });
     this.metadataGenerator = new MetadataGenerator(llm);
+    await this.metadataCache.load();
+
+    // Restore quality summaries for datasets ingested in previous sessions
+    this.restoreDatasetSummaries();
 
     // Create data directories if they don't exist
     await this.ensureDirectories();
@@ -190,17 +239,31 @@ export class DataProcessor {
     const parsedData = await parseCSV(content, filename);
     console.log(`   Schema: ${parsedData.columnCount} columns, ${parsedData.rowCount} rows`);
 
-    // Step 2: Load into DuckDB
-    const tableName = await this.duckdb.createTable(parsedData);
+    // Step 2 + 3: Load into DuckDB while profiling and generating enhanced metadata.
+    // Both only read parsedData, so the inserts overlap with the LLM description call.
+    // Unchanged files reuse cached metadata and skip profiling + the LLM call.
+    const tableName = sanitizeTableName(filename);
+    const datasetKind = classifyDataset(parsedData.headers);
+    const cacheKey = MetadataCache.key(filename, content);
+    const cachedMetadata = this.metadataCache.get(cacheKey);
+    if (cachedMetadata) {
+      console.log(`   ⚡ Using cached metadata for ${filename}`);
+    }
 
-    // Step 3: Generate enhanced metadata with statistical profiling
-    const enhancedMetadata = await this.metadataGenerator.generateEnhanced(parsedData, tableName);
+    const [, enhancedMetadata] = await Promise.all([
+      this.duckdb.createTable(parsedData),
+      cachedMetadata || this.metadataGenerator.generateEnhanced(parsedData, tableName),
+    ]);
+    if (!cachedMetadata) {
+      this.metadataCache.set(cacheKey, enhancedMetadata);
+    }
 
-    // Step 4: Index THREE documents for comprehensive understanding
+    // Step 4: Index metadata for comprehensive understanding
     const timestamp = Date.now();
     const baseMetadata = {
       filename: filename,
       tableId: tableName,
+      datasetKind,
       rowCount: parsedData.rowCount,
       columnCount: parsedData.columnCount,
       schema: parsedData.headers.map((col, i) => ({
@@ -212,12 +275,13 @@ export class DataProcessor {
       dataQuality: {
         completeness: enhancedMetadata.profile.dataQuality.completeness,
         missingValues: enhancedMetadata.profile.dataQuality.totalMissingValues,
+        duplicateRows: enhancedMetadata.profile.dataQuality.duplicateRows,
       },
       insights: enhancedMetadata.profile.insights,
       gaps: enhancedMetadata.profile.gaps,
     };
 
-    // Document 1: Basic description (for dataset discovery)
+    // Document 1: Basic description (for dataset discovery) - the only embedded document
     await this.vectorSearch!.addDocument({
       id: `dataset_${tableName}_desc_${timestamp}`,
       content: enhancedMetadata.basicDescription,
@@ -242,8 +306,11 @@ export class DataProcessor {
       ],
     });
 
-    // Document 2: Statistical summary (for statistical queries)
-    await this.vectorSearch!.addDocument({
+    // Documents 2 + 3: Statistical summary and insights & gaps.
+    // Stored as metadata-only records (looked up by tableId when the dataset is found)
+    // instead of being embedded - they are poor semantic-retrieval targets and cost
+    // an embedding call each.
+    this.vectorSearch!.addRecord({
       id: `dataset_${tableName}_stats_${timestamp}`,
       content: enhancedMetadata.statisticalSummary,
       metadata: {
@@ -251,48 +318,34 @@ export class DataProcessor {
         type: 'csv_statistics',
         documentType: 'statistics',
       },
-      chunks: [
-        {
-          text: enhancedMetadata.statisticalSummary,
-          metadata: {
-            type: 'csv_statistics',
-            tableId: tableName,
-            filename: filename,
-          },
-        },
-      ],
     });
 
-    // Document 3: Insights & gaps (for proactive analysis)
-    await this.vectorSearch!.addDocument({
+    this.vectorSearch!.addRecord({
       id: `dataset_${tableName}_insights_${timestamp}`,
       content: enhancedMetadata.insightsDocument,
       metadata: {
         ...baseMetadata,
         type: 'csv_insights',
         documentType: 'insights',
+        anomalies: enhancedMetadata.profile.anomalies,
       },
-      chunks: [
-        {
-          text: enhancedMetadata.insightsDocument,
-          metadata: {
-            type: 'csv_insights',
-            tableId: tableName,
-            filename: filename,
-            gaps: enhancedMetadata.profile.gaps,
-            anomalies: enhancedMetadata.profile.anomalies,
-          },
-        },
-      ],
     });
 
-    // Update stats - CSV files create 3 metadata documents
+    // Cache the quality summary so stats requests never rescan the rows
+    this.datasetSummaries.set(tableName, {
+      tableName,
+      filename,
+      kind: datasetKind,
+      rowCount: parsedData.rowCount,
+      completeness: enhancedMetadata.profile.dataQuality.completeness,
+      missingValues: enhancedMetadata.profile.dataQuality.totalMissingValues,
+      duplicateRows: enhancedMetadata.profile.dataQuality.duplicateRows,
+    });
+
+    // Update stats - CSV files index 1 metadata document (statistics/insights are records)
     // Note: totalFiles and vectorEmbeddings are computed dynamically in getDataStats()
     this.stats.documentTypes['csv_description'] =
       (this.stats.documentTypes['csv_description'] || 0) + 1;
-    this.stats.documentTypes['csv_statistics'] =
-      (this.stats.documentTypes['csv_statistics'] || 0) + 1;
-    this.stats.documentTypes['csv_insights'] = (this.stats.documentTypes['csv_insights'] || 0) + 1;
     this.stats.lastUpdated = new Date().toISOString();
 
     console.log(`✅ Processed structured data: ${tableName}`);
@@ -354,6 +407,31 @@ export class DataProcessor {
     return typeMap[ext || ''] || 'unknown';
   }
 
+  /**
+   * Rebuild per-table quality summaries from persisted statistics records
+   */
+  private restoreDatasetSummaries(): void {
+    if (!this.vectorSearch) return;
+
+    for (const record of this.vectorSearch.getRecords({ type: 'csv_statistics' })) {
+      const { tableId, filename, datasetKind, schema, rowCount, dataQuality } = record.metadata;
+      if (!tableId || !dataQuality) continue;
+
+      this.datasetSummaries.set(tableId, {
+        tableName: tableId,
+        filename,
+        // Records written before classification existed carry only the schema
+        kind:
+          datasetKind ||
+          classifyDataset((schema || []).map((col: { name: string }) => col.name)),
+        rowCount: rowCount || 0,
+        completeness: dataQuality.completeness || 0,
+        missingValues: dataQuality.missingValues || 0,
+        duplicateRows: dataQuality.duplicateRows || 0,
+      });
+    }
+  }
+
   async getDataStats(): Promise<DataStats> {
     if (this.vectorSearch) {
       const vectorStats = await this.vectorSearch.getStats();
@@ -361,6 +439,31 @@ export class DataProcessor {
       this.stats.totalFiles = vectorStats.totalFiles;
     }
 
+    // Aggregate cached per-table summaries (O(tables), no row scans)
+    let totalRows = 0;
+    let completeRows = 0;
+    let missingValues = 0;
+    let duplicateRows = 0;
+    const structuredRecords = { companies: 0, transactions: 0, customers: 0 };
+    for (const summary of this.datasetSummaries.values()) {
+      if (summary.kind === 'company') structuredRecords.companies += summary.rowCount;
+      else if (summary.kind === 'transaction') structuredRecords.transactions += summary.rowCount;
+      else if (summary.kind === 'customer') structuredRecords.customers += summary.rowCount;
+
+      totalRows += summary.rowCount;
+      completeRows += (summary.completeness / 100) * summary.rowCount;
+      missingValues += summary.missingValues;
+      duplicateRows += summary.duplicateRows;
+    }
+
+    this.stats.structuredRecords = structuredRecords;
+    this.stats.dataQuality = {
+      datasets: this.datasetSummaries.size,
+      completeness: totalRows > 0 ? (completeRows / totalRows) * 100 : 0,
+      missingValues,
+      duplicateRows,
+    };
+
     return this.stats;
   }
 
@@ -378,8 +481,16 @@ export class DataProcessor {
     return this.vectorSearch;
   }
 
+  /**
+   * Persist cached dataset metadata (call after batch loading)
+   */
+  async saveMetadataCache(): Promise<void> {
+    await this.metadataCache.save();
+  }
+
   async cleanup(): Promise<void> {
     console.log('🧹 Cleaning up data processor...');
+    await this.metadataCache.save();
     if (this.vectorSearch) {
       await this.vectorSearch.cleanup();
     }
@@ -1,3 +1,4 @@
+import * as crypto from 'crypto';
 import pdf from 'pdf-parse';
 import * as XLSX from 'xlsx';
 import * as mammoth from 'mammoth';
@@ -20,6 +21,30 @@ export interface ParsedDocument {
   }>;
 }
 
+/**
+ * pdf-parse page renderer: collects text items into an array and joins once
+ * (the default renderer concatenates strings item by item) and prefixes page markers
+ */
+function renderPdfPage(pageData: any): any {
+  return pageData
+    .getTextContent({ normalizeWhitespace: false, disableCombineTextItems: false })
+    .then((textContent: { items: Array<{ str: string; transform: number[] }> }) => {
+      const parts: string[] = [`--- Page ${pageData.pageIndex + 1} ---\n`];
+      let lastY: number | undefined;
+
+      for (const item of textContent.items) {
+        const y = item.transform[5];
+        if (lastY !== undefined && y !== lastY) {
+          parts.push('\n');
+        }
+        parts.push(item.str);
+        lastY = y;
+      }
+
+      return parts.join('');
+    });
+}
+
 export class DocumentParser {
   private textSplitter: RecursiveCharacterTextSplitter;
   private reductoClient: ReductoClient | null = null;
@@ -143,7 +168,7 @@ export class DocumentParser {
     // Fallback to standard pdf-parse
     try {
       console.log('📄 Using pdf-parse for PDF parsing...');
-      const data = await pdf(buffer);
+      const data = await pdf(buffer, { pagerender: renderPdfPage });
       console.log(`✅ pdf-parse extracted ${data.text.length} characters`);
       return data.text;
     } catch (error) {
@@ -157,37 +182,44 @@ export class DocumentParser {
     metadata: Record<string, any>;
   }> {
     try {
-      const workbook = XLSX.read(buffer, { type: 'buffer' });
+      // Skip HTML rendering and formula extraction - only cell values are used.
+      // Dense mode stores cells as row arrays instead of one object key per A1 address,
+      // which cuts memory and speeds up the sheet_to_csv/sheet_to_json walks on large sheets.
+      const workbook = XLSX.read(buffer, {
+        type: 'buffer',
+        dense: true,
+        cellHTML: false,
+        cellFormula: false,
+      });
       const metadata: Record<string, any> = {
         sheetNames: workbook.SheetNames,
         sheetsCount: workbook.SheetNames.length,
       };
 
-      let content = '';
-      const dataFrames: Record<string, any[]> = {};
+      // Collect sheet text in an array and join once instead of growing a string per sheet.
+      // Raw sheet rows are not kept in metadata: metadata is copied onto every chunk and
+      // persisted with it, so carrying whole sheets multiplied memory and cache size.
+      const parts: string[] = [];
 
       // Process each sheet
       for (const sheetName of workbook.SheetNames) {
         const sheet = workbook.Sheets[sheetName];
-        const jsonData = XLSX.utils.sheet_to_json(sheet, { header: 1 });
         const csvData = XLSX.utils.sheet_to_csv(sheet);
 
-        // Store structured data
-        dataFrames[sheetName] = jsonData;
-
         // Add to content for text processing
-        content += `\n\n=== Sheet: ${sheetName} ===\n${csvData}`;
+        parts.push(`\n\n=== Sheet: ${sheetName} ===\n${csvData}`);
 
         // Extract metadata from first sheet
-        if (sheetName === workbook.SheetNames[0] && jsonData.length > 0) {
-          metadata.rowCount = jsonData.length;
-          metadata.columnCount = (jsonData[0] as any[]).length;
+        if (sheetName === workbook.SheetNames[0]) {
+          const jsonData = XLSX.utils.sheet_to_json(sheet, { header: 1 });
+          if (jsonData.length > 0) {
+            metadata.rowCount = jsonData.length;
+            metadata.columnCount = (jsonData[0] as any[]).length;
+          }
         }
       }
 
-      metadata.dataFrames = dataFrames;
-
-      return { content, metadata };
+      return { content: parts.join(''), metadata };
     } catch (error) {
       console.error('Excel parsing error:', error);
       throw new Error('Failed to parse Excel file');
@@ -205,15 +237,12 @@ export class DocumentParser {
   }
 
   private async parseCSV(buffer: Buffer): Promise<string> {
-    try {
-      const text = buffer.toString('utf-8');
-      const workbook = XLSX.read(text, { type: 'string' });
-      const sheet = workbook.Sheets[workbook.SheetNames[0]];
-      return XLSX.utils.sheet_to_csv(sheet);
-    } catch (error) {
-      // Fallback to raw text if XLSX parsing fails
-      return buffer.toString('utf-8');
-    }
+    // CSV is already text - skip the SheetJS workbook round-trip (parse + re-serialize).
+    // Papa Parse handles the actual parsing on the structured data path.
+    const text = buffer.toString('utf-8');
+
+    // Remove UTF-8 BOM if present
+    return text.charCodeAt(0) === 0xfeff ? text.slice(1) : text;
   }
 
   private async createChunks(
@@ -221,14 +250,15 @@ export class DocumentParser {
     metadata: Record<string, any>
   ): Promise<Array<{ text: string; metadata: Record<string, any> }>> {
     try {
-      const documents = await this.textSplitter.createDocuments([content], [metadata]);
+      // splitText avoids createDocuments' Document wrapping and per-chunk line-offset scan
+      const texts = await this.textSplitter.splitText(content);
 
-      return documents.map((doc, index) => ({
-        text: doc.pageContent,
+      return texts.map((text, index) => ({
+        text,
         metadata: {
-          ...doc.metadata,
+          ...metadata,
           chunkIndex: index,
-          chunkTotal: documents.length,
+          chunkTotal: texts.length,
         },
       }));
     } catch (error) {
@@ -260,7 +290,8 @@ export class DocumentParser {
 
   private generateDocumentId(filename: string): string {
     const timestamp = Date.now();
-    const random = Math.random().toString(36).substring(7);
+    // Fixed-length suffix from the CSPRNG (Math.random base36 slices can come out short)
+    const random = crypto.randomBytes(4).toString('hex');
     const cleanName = filename.replace(/[^a-zA-Z0-9]/g, '_');
     return `${cleanName}_${timestamp}_${random}`;
   }
@@ -0,0 +1,217 @@
+import { Embeddings } from '@langchain/core/embeddings';
+import * as crypto from 'crypto';
+import * as fs from 'fs/promises';
+import * as path from 'path';
+import { LRUCache } from '../utils/lruCache';
+
+/**
+ * Embeddings wrapper with a persistent, content-addressed vector cache
+ * Keys are sha256(model + "\0" + text), so unchanged chunks are never re-embedded -
+ * reloading the vector store on startup costs zero API calls.
+ */
+export class CachedEmbeddings extends Embeddings {
+  private vectors: Map<string, number[]> = new Map();
+  private queryCache: LRUCache<string, Promise<number[]>>;
+  private dirty: boolean = false;
+
+  constructor(
+    private inner: Embeddings,
+    private modelName: string,
+    private cachePath: string = process.env.EMBEDDING_CACHE_PATH || './data/embedding_cache.json',
+    queryCacheSize: number = 2048
+  ) {
+    super({});
+    this.queryCache = new LRUCache(queryCacheSize);
+  }
+
+  private key(text: string): string {
+    return crypto
+      .createHash('sha256')
+      .update(this.modelName + '\0' + text)
+      .digest('hex');
+  }
+
+  async embedDocuments(texts: string[]): Promise<number[][]> {
+    const keys = texts.map(text => this.key(text));
+    const result: number[][] = new Array(texts.length);
+
+    // Collect misses (deduplicated) - only these go to the API
+    const missIndex = new Map<string, number>();
+    const missTexts: string[] = [];
+    keys.forEach((key, i) => {
+      const cached = this.vectors.get(key);
+      if (cached) {
+        result[i] = cached;
+      } else if (!missIndex.has(key)) {
+        missIndex.set(key, missTexts.length);
+        missTexts.push(texts[i]);
+      }
+    });
+
+    if (missTexts.length > 0) {
+      const fresh = await this.inner.embedDocuments(missTexts);
+      missIndex.forEach((position, key) => this.vectors.set(key, fresh[position]));
+      keys.forEach((key, i) => {
+        if (!result[i]) {
+          result[i] = fresh[missIndex.get(key)!];
+        }
+      });
+      this.dirty = true;
+    }
+
+    return result;
+  }
+
+  async embedQuery(text: string): Promise<number[]> {
+    const key = this.key(text);
+    const stored = this.vectors.get(key);
+    if (stored) {
+      return stored;
+    }
+
+    // Share in-flight requests for repeated user queries
+    let pending = this.queryCache.get(key);
+    if (!pending) {
+      pending = this.inner.embedQuery(text);
+      this.queryCache.set(key, pending);
+      pending.catch(() => this.queryCache.delete(key));
+    }
+    return pending;
+  }
+
+  /**
+   * Load cached vectors from disk (base64-encoded float16)
+   */
+  async load(): Promise<void> {
+    try {
+      const data = await fs.readFile(this.cachePath, 'utf-8');
+      const cached = JSON.parse(data);
+
+      // Caches written before the float16 format are a flat map of float32 vectors
+      const isHalf = cached.dtype === 'float16';
+      const entries: Record<string, string> = isHalf ? cached.vectors : cached;
+
+      for (const [key, encoded] of Object.entries(entries)) {
+        const buffer = Buffer.from(encoded, 'base64');
+        this.vectors.set(key, isHalf ? decodeFloat16(buffer) : decodeFloat32(buffer));
+      }
+
+      console.log(`   🧠 Loaded ${this.vectors.size} cached embeddings`);
+    } catch {
+      // No cache yet (or unreadable) - start empty
+    }
+  }
+
+  /**
+   * Drop vectors for texts no longer indexed (deleted documents, re-chunked content)
+   * Keeps the cache - and every save - proportional to the live corpus
+   */
+  prune(liveTexts: Iterable<string>): void {
+    const live = new Set<string>();
+    for (const text of liveTexts) {
+      live.add(this.key(text));
+    }
+
+    const before = this.vectors.size;
+    this.vectors.forEach((_vector, key) => {
+      if (!live.has(key)) {
+        this.vectors.delete(key);
+      }
+    });
+
+    if (this.vectors.size !== before) {
+      this.dirty = true;
+      console.log(`   🧹 Pruned ${before - this.vectors.size} stale embeddings`);
+    }
+  }
+
+  /**
+   * Persist cached vectors if anything changed since the last save
+   * Stored as float16 - half the size of float32, negligible recall loss for top-k retrieval
+   */
+  async save(): Promise<void> {
+    if (!this.dirty) {
+      return;
+    }
+
+    try {
+      const vectors: Record<string, string> = {};
+      this.vectors.forEach((vector, key) => {
+        vectors[key] = encodeFloat16(vector).toString('base64');
+      });
+
+      await fs.mkdir(path.dirname(this.cachePath), { recursive: true });
+      await fs.writeFile(this.cachePath, JSON.stringify({ dtype: 'float16', vectors }));
+      this.dirty = false;
+      console.log(`   💾 Saved ${this.vectors.size} embeddings to cache`);
+    } catch (error) {
+      console.error('   ⚠️  Failed to save embedding cache:', error);
+    }
+  }
+}
+
+// Scratch views for reinterpreting float32 bits
+const f32 = new Float32Array(1);
+const u32 = new Uint32Array(f32.buffer);
+
+/**
+ * Convert a number to IEEE 754 half-precision bits (round to nearest)
+ */
+function toHalf(value: number): number {
+  f32[0] = value;
+  const bits = u32[0];
+  const sign = (bits >>> 16) & 0x8000;
+  const exponent = ((bits >>> 23) & 0xff) - 127 + 15;
+  const mantissa = bits & 0x7fffff;
+
+  // Overflow, Infinity or NaN
+  if (exponent >= 0x1f) {
+    const isNaN = ((bits >>> 23) & 0xff) === 0xff && mantissa !== 0;
+    return sign | 0x7c00 | (isNaN ? 0x200 : 0);
+  }
+
+  // Subnormal half (or underflow to signed zero)
+  if (exponent <= 0) {
+    if (exponent < -10) return sign;
+    const full = mantissa | 0x800000;
+    const shift = 14 - exponent;
+    return sign | ((full >> shift) + ((full >> (shift - 1)) & 1));
+  }
+
+  // Normal half - a rounding carry correctly bumps the exponent
+  return (sign | (exponent << 10) | (mantissa >> 13)) + ((mantissa >> 12) & 1);
+}
+
+function fromHalf(half: number): number {
+  const sign = half & 0x8000 ? -1 : 1;
+  const exponent = (half >>> 10) & 0x1f;
+  const mantissa = half & 0x3ff;
+
+  if (exponent === 0) return sign * mantissa * 2 ** -24;
+  if (exponent === 0x1f) return mantissa ? NaN : sign * Infinity;
+  return sign * (1 + mantissa / 1024) * 2 ** (exponent - 15);
+}
+
+function encodeFloat16(vector: number[]): Buffer {
+  const buffer = Buffer.allocUnsafe(vector.length * 2);
+  for (let i = 0; i < vector.length; i++) {
+    buffer.writeUInt16LE(toHalf(vector[i]), i * 2);
+  }
+  return buffer;
+}
+
+function decodeFloat16(buffer: Buffer): number[] {
+  const vector = new Array<number>(buffer.length / 2);
+  for (let i = 0; i < vector.length; i++) {
+    vector[i] = fromHalf(buffer.readUInt16LE(i * 2));
+  }
+  return vector;
+}
+
+function decodeFloat32(buffer: Buffer): number[] {
+  const vector = new Array<number>(buffer.length / 4);
+  for (let i = 0; i < vector.length; i++) {
+    vector[i] = buffer.readFloatLE(i * 4);
+  }
+  return vector;
+}
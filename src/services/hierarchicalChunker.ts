@@ -162,12 +162,12 @@ export class HierarchicalChunker {
     filename: string,
     sections: DocumentSection[]
   ): Promise<HierarchicalChunk[]> {
-    const parentDocs = await this.parentSplitter.createDocuments([text]);
+    // splitText skips the Document wrapping and per-chunk line-offset scan of createDocuments
+    const parentTexts = await this.parentSplitter.splitText(text);
     const parents: HierarchicalChunk[] = [];
 
-    for (let i = 0; i < parentDocs.length; i++) {
-      const doc = parentDocs[i];
-      const content = doc.pageContent;
+    for (let i = 0; i < parentTexts.length; i++) {
+      const content = parentTexts[i];
 
       // Find which section this chunk belongs to
       const section = this.findSectionForText(content, sections);
@@ -184,7 +184,7 @@ export class HierarchicalChunker {
           hierarchyLevel: section?.level || 0,
           contentType: this.detectContentType(content),
           chunkIndex: i,
-          chunkTotal: parentDocs.length,
+          chunkTotal: parentTexts.length,
           charCount: content.length,
           wordCount: content.split(/\s+/).length,
           createdAt: new Date().toISOString(),
@@ -205,12 +205,11 @@ export class HierarchicalChunker {
     documentId: string,
     filename: string
   ): Promise<HierarchicalChunk[]> {
-    const childDocs = await this.childSplitter.createDocuments([parent.content]);
+    const childTexts = await this.childSplitter.splitText(parent.content);
     const children: HierarchicalChunk[] = [];
 
-    for (let i = 0; i < childDocs.length; i++) {
-      const doc = childDocs[i];
-      const content = doc.pageContent;
+    for (let i = 0; i < childTexts.length; i++) {
+      const content = childTexts[i];
 
       const childId = `${parent.id}_child_${i}`;
 
@@ -226,7 +225,7 @@ export class HierarchicalChunker {
           hierarchyLevel: (parent.metadata.hierarchyLevel || 0) + 1,
           contentType: this.detectContentType(content),
           chunkIndex: i,
-          chunkTotal: childDocs.length,
+          chunkTotal: childTexts.length,
           charCount: content.length,
           wordCount: content.split(/\s+/).length,
           createdAt: new Date().toISOString(),
@@ -4,6 +4,8 @@ import { VectorSearchService } from './vectorSearch';
 import { AgenticRAG } from '../agents/agenticRAG';
 import { ParentChildRetriever, EnhancedSearchResult } from './parentChildRetriever';
 import { DataProcessor } from './dataProcessor';
+import { SemanticAnswerCache } from './answerCache';
+import { fitToTokenBudget } from '../utils/tokenBudget';
 
 export interface QueryResult {
   answer: string;
@@ -13,6 +15,7 @@ export interface QueryResult {
   }>;
   confidence: number;
   processingTime: number;
+  cached?: boolean;
   reasoning?: {
     thoughts: string[];
     toolsUsed: string[];
@@ -20,11 +23,20 @@ export interface QueryResult {
   };
 }
 
+// Placeholder answer when the agent finishes without producing one
+const NO_ANSWER_FALLBACK = 'No answer generated';
+
 export class QueryEngine {
   private llm: ChatOpenAI;
   private vectorSearch: VectorSearchService;
   private parentChildRetriever: ParentChildRetriever | null = null;
   private agenticRAG: AgenticRAG | null = null;
+  private answerCache: SemanticAnswerCache<QueryResult> | null = null;
+  // Answers below this confidence (percent) are never cached
+  private answerCacheMinConfidence =
+    parseFloat(process.env.ANSWER_CACHE_MIN_CONFIDENCE || '60') || 60;
+  // Prompt context budget - lowest-ranked sources are dropped beyond this
+  private maxContextTokens = parseInt(process.env.MAX_CONTEXT_TOKENS || '3500') || 3500;
 
   constructor(
     vectorSearch: VectorSearchService,
@@ -34,6 +46,11 @@ export class QueryEngine {
     this.vectorSearch = vectorSearch;
     this.parentChildRetriever = parentChildRetriever || null;
 
+    // Semantic answer cache (skip the LLM for near-duplicate questions) - opt-in
+    if (process.env.ENABLE_ANSWER_CACHE === 'true') {
+      this.answerCache = new SemanticAnswerCache(vectorSearch.getEmbeddings());
+    }
+
     // Initialize Agentic RAG if enabled
     if (process.env.USE_AGENTIC_RAG === 'true') {
       try {
@@ -57,7 +74,51 @@ export class QueryEngine {
     });
   }
 
-  async executeQuery(query: string, filters?: Record<string, any>): Promise<QueryResult> {
+  /**
+   * Answer a query. When onToken is given, basic-RAG answers are streamed token by token
+   * (agentic answers and cache hits arrive whole in the returned result).
+   */
+  async executeQuery(
+    query: string,
+    filters?: Record<string, any>,
+    onToken?: (token: string) => void
+  ): Promise<QueryResult> {
+    if (!this.answerCache) {
+      return this.answerQuery(query, filters, onToken);
+    }
+
+    const startTime = Date.now();
+    const revision = this.vectorSearch.getRevision();
+    let embedding: Float32Array | null = null;
+
+    try {
+      embedding = await this.answerCache.embed(query);
+      const hit = this.answerCache.lookup(query, embedding, revision, filters);
+      if (hit) {
+        console.log(
+          `⚡ Answer cache hit (similarity ${hit.similarity.toFixed(3)}, cached query: "${hit.query}")`
+        );
+        return { ...hit.value, cached: true, processingTime: Date.now() - startTime };
+      }
+    } catch (error) {
+      console.error('⚠️  Answer cache lookup failed:', error);
+    }
+
+    // Retrieval embeds the same query text - the shared embeddings LRU dedupes that request
+    const result = await this.answerQuery(query, filters, onToken);
+
+    // Don't cache answers computed against a corpus that changed mid-query
+    if (embedding && revision === this.vectorSearch.getRevision() && this.isCacheable(result)) {
+      this.answerCache.store(query, embedding, revision, result, filters);
+    }
+    return result;
+  }
+
+  private async answerQuery(
+    query: string,
+    filters?: Record<string, any>,
+    onToken?: (token: string) => void
+  ): Promise<QueryResult> {
     const startTime = Date.now();
 
     // Try Agentic RAG first if available
@@ -74,12 +135,13 @@ export class QueryEngine {
         console.log(`   Tools used: ${agenticResult.reasoning?.toolsUsed?.join(', ') || 'none'}`);
 
         // Calculate confidence based on sources (if we have sources with good similarity scores)
-        let confidence = 0.85; // Default high confidence for agentic
+        // Reported as a percent, the same scale as the basic RAG paths
+        let confidence = 85; // Default high confidence for agentic
         if (agenticResult.sources && agenticResult.sources.length > 0) {
           const avgSimilarity =
             agenticResult.sources.reduce((sum, s) => sum + (s.similarity || 0), 0) /
             agenticResult.sources.length;
-          confidence = Math.min(0.95, 0.7 + avgSimilarity * 0.25); // 70-95% range
+          confidence = Math.round(Math.min(95, 70 + avgSimilarity * 25)); // 70-95% range
         }
 
         // Safely convert sources array (defensive mapping with fallbacks)
@@ -94,7 +156,7 @@ export class QueryEngine {
 
         // Build result with defensive property access
         const result: QueryResult = {
-          answer: agenticResult.answer || 'No answer generated',
+          answer: agenticResult.answer || NO_ANSWER_FALLBACK,
           sources: convertedSources,
           confidence: confidence,
           processingTime: agenticResult.metadata?.duration || Date.now() - startTime,
@@ -129,7 +191,13 @@ export class QueryEngine {
         const context = this.buildHierarchicalContext(enhancedResults);
 
         // Build QueryResult from enhanced results
-        return await this.buildQueryResultFromEnhanced(query, enhancedResults, context, startTime);
+        return await this.buildQueryResultFromEnhanced(
+          query,
+          enhancedResults,
+          context,
+          startTime,
+          onToken
+        );
       }
 
       // Standard search (fallback)
@@ -158,10 +226,10 @@ ${context}`;
 
 Please provide a comprehensive answer based on the available data.`;
 
-      // Get response from GPT-5
+      // Get response from GPT-5 (streamed when a token callback is provided)
       const messages = [new SystemMessage(systemPrompt), new HumanMessage(userPrompt)];
 
-      const response = await this.llm.invoke(messages);
+      const answer = await this.generateAnswer(messages, onToken);
 
       // Calculate confidence based on search results
       const confidence = this.calculateConfidence(searchResults);
@@ -169,7 +237,7 @@ Please provide a comprehensive answer based on the available data.`;
       const processingTime = Date.now() - startTime;
 
       return {
-        answer: response.content.toString(),
+        answer,
         sources: searchResults.slice(0, 5).map(r => ({
           content: r.content,
           metadata: r.metadata,
@@ -202,16 +270,7 @@ Context: ${context}`;
       const messages = [new SystemMessage(systemPrompt), new HumanMessage(query)];
 
       // Stream the response
-      let fullResponse = '';
-      const stream = await this.llm.stream(messages);
-
-      for await (const chunk of stream) {
-        const token = chunk.content.toString();
-        fullResponse += token;
-        if (onToken) {
-          onToken(token);
-        }
-      }
+      const fullResponse = await this.generateAnswer(messages, onToken);
 
       const confidence = this.calculateConfidence(searchResults);
       const processingTime = Date.now() - startTime;
@@ -279,22 +338,57 @@ Provide a structured analysis focusing on completeness, accuracy, and consistenc
     }
   }
 
+  /**
+   * Run the LLM, streaming tokens to onToken as they arrive (shortens time-to-first-token)
+   */
+  private async generateAnswer(
+    messages: Array<SystemMessage | HumanMessage>,
+    onToken?: (token: string) => void
+  ): Promise<string> {
+    if (!onToken) {
+      const response = await this.llm.invoke(messages);
+      return response.content.toString();
+    }
+
+    let answer = '';
+    const stream = await this.llm.stream(messages);
+    for await (const chunk of stream) {
+      const token = chunk.content.toString();
+      answer += token;
+      onToken(token);
+    }
+    return answer;
+  }
+
   private buildContext(searchResults: any[]): string {
     if (searchResults.length === 0) {
       return 'No relevant documents found in the database.';
     }
 
-    return searchResults
-      .map((result, index) => {
-        const metadata = result.metadata || {};
-        const source = metadata.source || 'Unknown source';
-        const type = metadata.type || 'Document';
+    const sections = searchResults.map((result, index) => {
+      const metadata = result.metadata || {};
+      const source = metadata.source || 'Unknown source';
+      const type = metadata.type || 'Document';
 
-        return `[Source ${index + 1}] (${type} - ${source}):
+      return `[Source ${index + 1}] (${type} - ${source}):
 ${result.content}
 ---`;
-      })
-      .join('\n\n');
+    });
+
+    // Results are ranked, so keep the best sources that fit the token budget
+    return fitToTokenBudget(sections, this.maxContextTokens).join('\n\n');
+  }
+
+  /**
+   * Only reuse real, reasonably confident answers - a bad answer would otherwise be
+   * served for every near-duplicate question until the TTL expires
+   */
+  private isCacheable(result: QueryResult): boolean {
+    const answer = result.answer.trim();
+    if (!answer || answer === NO_ANSWER_FALLBACK) {
+      return false;
+    }
+    return result.confidence >= this.answerCacheMinConfidence;
   }
 
   private calculateConfidence(searchResults: any[]): number {
@@ -350,31 +444,32 @@ ${result.content}
       return 'No relevant documents found in the database.';
     }
 
-    return results
-      .map((result, index) => {
-        const hierarchyPath = result.hierarchyPath?.join(' > ') || 'Unknown';
-        const filename = result.childMetadata.filename || 'Unknown';
-        const section = result.section || 'No section';
+    const sections = results.map((result, index) => {
+      const hierarchyPath = result.hierarchyPath?.join(' > ') || 'Unknown';
+      const filename = result.childMetadata.filename || 'Unknown';
+      const section = result.section || 'No section';
 
-        // Build context with both child (matched) and parent (full context)
-        let contextStr = `[Source ${index + 1}] ${filename} > ${section}
+      // Build context with both child (matched) and parent (full context)
+      let contextStr = `[Source ${index + 1}] ${filename} > ${section}
 Hierarchy: ${hierarchyPath}
 
 📍 Matched Section (Similarity: ${result.childSimilarity.toFixed(3)}):
 ${result.childChunk}`;
 
-        // Add parent context if available (provides surrounding context)
-        if (result.parentChunk) {
-          contextStr += `
+      // Add parent context if available (provides surrounding context)
+      if (result.parentChunk) {
+        contextStr += `
 
 📄 Full Context (Parent Chunk):
 ${result.parentChunk}`;
-        }
+      }
 
-        contextStr += '\n---';
-        return contextStr;
-      })
-      .join('\n\n');
+      contextStr += '\n---';
+      return contextStr;
+    });
+
+    // Keep the best-matching sections that fit the token budget
+    return fitToTokenBudget(sections, this.maxContextTokens).join('\n\n');
   }
 
   /**
@@ -384,7 +479,8 @@ ${result.parentChunk}`;
     query: string,
     enhancedResults: EnhancedSearchResult[],
     context: string,
-    startTime: number
+    startTime: number,
+    onToken?: (token: string) => void
   ): Promise<QueryResult> {
     // Create the prompt with hierarchical context
     const systemPrompt = `You are an expert Private Equity analyst with deep knowledge of financial analysis, due diligence, and investment evaluation. You have access to a comprehensive database of PE-related documents and data.
@@ -409,9 +505,9 @@ ${context}`;
 
 Please provide a comprehensive answer based on the available data.`;
 
-    // Get response from GPT-5
+    // Get response from GPT-5 (streamed when a token callback is provided)
     const messages = [new SystemMessage(systemPrompt), new HumanMessage(userPrompt)];
-    const response = await this.llm.invoke(messages);
+    const answer = await this.generateAnswer(messages, onToken);
 
     // Calculate confidence based on child similarities
     const avgSimilarity =
@@ -421,7 +517,7 @@ Please provide a comprehensive answer based on the available data.`;
     const processingTime = Date.now() - startTime;
 
     return {
-      answer: response.content.toString(),
+      answer,
       sources: enhancedResults.slice(0, 5).map(r => ({
         content: r.parentChunk || r.childChunk, // Prefer parent for full context
         metadata: {
@@ -1,6 +1,7 @@
 import { ChromaClient, Collection } from 'chromadb';
 import { OpenAIEmbeddings } from '@langchain/openai';
 import { Document } from 'langchain/document';
+import { embeddingConfig } from '../config/embedding.config';
 
 export interface SearchResult {
   content: string;
@@ -21,6 +22,8 @@ export class VectorSearchService {
     this.embeddings = new OpenAIEmbeddings({
       modelName: 'text-embedding-3-small',
       openAIApiKey: process.env.OPENAI_API_KEY,
+      batchSize: embeddingConfig.batchSize,
+      maxConcurrency: embeddingConfig.maxConcurrency,
     });
   }
 
@@ -59,9 +62,8 @@ export class VectorSearchService {
       // Process chunks if available, otherwise treat whole content as single chunk
       const chunks = doc.chunks || [{ text: doc.content, metadata: doc.metadata }];
 
-      // Generate embeddings for all chunks in parallel
-      const embedPromises = chunks.map(chunk => this.embeddings.embedQuery(chunk.text));
-      const embeddings = await Promise.all(embedPromises);
+      // Embed all chunks in batched requests (one round-trip per batch, not per chunk)
+      const embeddings = await this.embeddings.embedDocuments(chunks.map(chunk => chunk.text));
 
       // Prepare data for ChromaDB
       const ids = chunks.map((_, index) => `${doc.id}_chunk_${index}`);
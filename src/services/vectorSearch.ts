@@ -1,6 +1,11 @@
 import { OpenAIEmbeddings } from '@langchain/openai';
 import { MemoryVectorStore } from 'langchain/vectorstores/memory';
 import { Document } from 'langchain/document';
+import { embeddingConfig } from '../config/embedding.config';
+import { CachedEmbeddings } from './embeddingCache';
+import { LRUCache } from '../utils/lruCache';
+import { mapWithConcurrency } from '../utils/concurrency';
+import * as crypto from 'crypto';
 import * as fs from 'fs/promises';
 import * as path from 'path';
 
@@ -13,6 +18,11 @@ export interface SearchResult {
 interface CachedDocument {
   pageContent: string;
   metadata: Record<string, any>;
+  indexed?: boolean; // false for metadata-only records (not embedded)
+}
+
+function hashPayload(payload: string): string {
+  return crypto.createHash('sha256').update(payload).digest('hex');
 }
 
 /**
@@ -22,19 +32,37 @@ interface CachedDocument {
  */
 export class VectorSearchService {
   private vectorStore: MemoryVectorStore;
-  private embeddings: OpenAIEmbeddings;
+  private embeddings: CachedEmbeddings;
   private cachePath: string;
+  // Hash of the cache file contents as last read/written, to skip identical rewrites
+  private cacheHash: string | null = null;
   private documents: Map<string, Document> = new Map();
+  // Metadata-only records: persisted alongside documents but never embedded or searched
+  private records: Map<string, Document> = new Map();
   private isCleanedUp: boolean = false;
+  // Bumped whenever indexed content changes (used to invalidate downstream caches)
+  private revision: number = 0;
+  // Recent search results, keyed by revision so any add/delete invalidates them
+  private searchCache = new LRUCache<string, SearchResult[]>(256);
+  private statsCache: {
+    revision: number;
+    stats: { totalFiles: number; vectorEmbeddings: number };
+  } | null = null;
 
   constructor() {
-    this.embeddings = new OpenAIEmbeddings({
-      modelName: 'text-embedding-3-small',
+    const modelName = 'text-embedding-3-small';
+    const openAIEmbeddings = new OpenAIEmbeddings({
+      modelName,
       openAIApiKey: process.env.OPENAI_API_KEY,
       timeout: 30000,
       maxRetries: 3,
+      batchSize: embeddingConfig.batchSize,
+      maxConcurrency: embeddingConfig.maxConcurrency,
     });
 
+    // Cache vectors by content hash so unchanged chunks are never re-embedded
+    this.embeddings = new CachedEmbeddings(openAIEmbeddings, modelName);
+
     this.vectorStore = new MemoryVectorStore(this.embeddings);
     this.cachePath = process.env.VECTOR_CACHE_PATH || './data/vector_cache.json';
   }
@@ -48,6 +76,9 @@ export class VectorSearchService {
       const cacheDir = path.dirname(this.cachePath);
       await fs.mkdir(cacheDir, { recursive: true });
 
+      // Load embedding cache first so restoring documents doesn't hit the API
+      await this.embeddings.load();
+
       // Try to load from cache
       const loaded = await this.loadFromCache();
 
@@ -75,26 +106,40 @@ export class VectorSearchService {
 
       const data = await fs.readFile(this.cachePath, 'utf-8');
       const cached: CachedDocument[] = JSON.parse(data);
+      this.cacheHash = hashPayload(data);
 
       if (cached.length === 0) {
         return false;
       }
 
+      // Restore metadata-only records without embedding them
+      cached
+        .filter((doc) => doc.indexed === false)
+        .forEach((doc) => {
+          this.records.set(
+            doc.metadata.documentId,
+            new Document({ pageContent: doc.pageContent, metadata: doc.metadata })
+          );
+        });
+
       // Reconstruct documents
-      const documents = cached.map(
-        (doc) => new Document({ pageContent: doc.pageContent, metadata: doc.metadata })
-      );
+      const documents = cached
+        .filter((doc) => doc.indexed !== false)
+        .map((doc) => new Document({ pageContent: doc.pageContent, metadata: doc.metadata }));
 
-      // Add to vector store (this will re-compute embeddings)
-      await this.vectorStore.addDocuments(documents);
+      // Add to vector store (embeddings come from the embedding cache when available)
+      await this.indexDocuments(documents);
 
       // Store references
       documents.forEach((doc) => {
         const key = `${doc.metadata.documentId}_${doc.metadata.chunkIndex}`;
         this.documents.set(key, doc);
       });
+      this.revision++;
 
-      console.log(`   📦 Loaded ${documents.length} cached documents`);
+      console.log(
+        `   📦 Loaded ${documents.length} cached documents (+${this.records.size} metadata records)`
+      );
       return true;
     } catch (error) {
       console.error('   ⚠️  Failed to load cache, starting fresh:', error);
@@ -108,6 +153,13 @@ export class VectorSearchService {
         pageContent: doc.pageContent,
         metadata: doc.metadata,
       }));
+      this.records.forEach((record) => {
+        documents.push({
+          pageContent: record.pageContent,
+          metadata: record.metadata,
+          indexed: false,
+        });
+      });
 
       // Defensive check: Warn if about to overwrite non-empty cache with empty state
       if (documents.length === 0) {
@@ -125,8 +177,20 @@ export class VectorSearchService {
         }
       }
 
-      await fs.writeFile(this.cachePath, JSON.stringify(documents, null, 2));
-      console.log(`   💾 Saved ${documents.length} documents to cache`);
+      // Compact JSON - pretty-printing roughly doubles the file size and write time
+      const payload = JSON.stringify(documents);
+      const payloadHash = hashPayload(payload);
+      if (payloadHash === this.cacheHash) {
+        console.log(`   ⏭️  Cache unchanged (${documents.length} documents), skipping write`);
+      } else {
+        await fs.writeFile(this.cachePath, payload);
+        this.cacheHash = payloadHash;
+        console.log(`   💾 Saved ${documents.length} documents to cache`);
+      }
+
+      // Only vectors of currently indexed chunks are worth keeping on disk
+      this.embeddings.prune(Array.from(this.documents.values(), (doc) => doc.pageContent));
+      await this.embeddings.save();
     } catch (error) {
       console.error('   ⚠️  Failed to save cache:', error);
     }
@@ -156,13 +220,14 @@ export class VectorSearchService {
       );
 
       // Add to vector store
-      await this.vectorStore.addDocuments(documents);
+      await this.indexDocuments(documents);
 
       // Store references
       documents.forEach((doc) => {
         const key = `${doc.metadata.documentId}_${doc.metadata.chunkIndex}`;
         this.documents.set(key, doc);
       });
+      this.revision++;
 
       // Don't save on every add - too slow. Will save in cleanup or manually
       console.log(`📄 Added document ${doc.id} with ${chunks.length} chunks`);
@@ -172,6 +237,57 @@ export class VectorSearchService {
     }
   }
 
+  /**
+   * Embed documents in batches with a bounded number of requests in flight, then index them
+   * Nothing is added to the store unless every batch embeds, so a failed document leaves no
+   * untracked, unpersisted chunks behind (and a retry doesn't duplicate them).
+   */
+  private async indexDocuments(documents: Document[]): Promise<void> {
+    const batches: Document[][] = [];
+    for (let i = 0; i < documents.length; i += embeddingConfig.batchSize) {
+      batches.push(documents.slice(i, i + embeddingConfig.batchSize));
+    }
+
+    const batchVectors = await mapWithConcurrency(
+      batches,
+      embeddingConfig.maxConcurrency,
+      (batch) => this.embeddings.embedDocuments(batch.map((doc) => doc.pageContent))
+    );
+
+    await this.vectorStore.addVectors(batchVectors.flat(), documents);
+  }
+
+  /**
+   * Store a metadata-only record (no embedding, excluded from search and counts)
+   * Used for content looked up by key rather than retrieved semantically
+   */
+  addRecord(record: { id: string; content: string; metadata: Record<string, any> }): void {
+    this.records.set(
+      record.id,
+      new Document({
+        pageContent: record.content,
+        metadata: {
+          ...record.metadata,
+          documentId: record.id,
+          timestamp: new Date().toISOString(),
+        },
+      })
+    );
+  }
+
+  /**
+   * Get metadata-only records whose metadata matches every key in the filter
+   */
+  getRecords(filter: Record<string, any>): SearchResult[] {
+    const matches: SearchResult[] = [];
+    this.records.forEach((record) => {
+      if (Object.entries(filter).every(([key, value]) => record.metadata[key] === value)) {
+        matches.push({ content: record.pageContent, metadata: record.metadata, score: 1 });
+      }
+    });
+    return matches;
+  }
+
   async search(
     query: string,
     k: number = 5,
@@ -183,6 +299,14 @@ export class VectorSearchService {
       console.log(`   K: ${k}`);
       console.log(`   Documents in cache: ${this.documents.size}`);
 
+      const normalizedQuery = query.trim().replace(/\s+/g, ' ').toLowerCase();
+      const cacheKey = `${this.revision}|${k}|${JSON.stringify(filter || {})}|${normalizedQuery}`;
+      const cachedResults = this.searchCache.get(cacheKey);
+      if (cachedResults) {
+        console.log(`   ⚡ Returning ${cachedResults.length} cached results`);
+        return cachedResults.slice();
+      }
+
       // Perform similarity search
       const results = await this.vectorStore.similaritySearchWithScore(query, k);
 
@@ -201,8 +325,10 @@ export class VectorSearchService {
         score: 1 - score, // Convert distance to similarity score
       }));
 
+      this.searchCache.set(cacheKey, searchResults);
+
       console.log(`   Returning ${searchResults.length} formatted results`);
-      return searchResults;
+      return searchResults.slice();
     } catch (error) {
       console.error('❌ Search error:', error);
       throw error;
@@ -220,6 +346,8 @@ export class VectorSearchService {
       });
 
       keysToDelete.forEach((key) => this.documents.delete(key));
+      this.records.delete(documentId);
+      this.revision++;
 
       // Save updated cache
       await this.saveToCache();
@@ -235,6 +363,11 @@ export class VectorSearchService {
     totalFiles: number;
     vectorEmbeddings: number;
   }> {
+    // Polled by /api/stats - only rescan documents when the store has changed
+    if (this.statsCache && this.statsCache.revision === this.revision) {
+      return this.statsCache.stats;
+    }
+
     // Count unique filenames (source files), not documentIds
     const uniqueFiles = new Set<string>();
     this.documents.forEach((doc) => {
@@ -243,10 +376,26 @@ export class VectorSearchService {
       }
     });
 
-    return {
+    const stats = {
       totalFiles: uniqueFiles.size,
       vectorEmbeddings: this.documents.size,
     };
+    this.statsCache = { revision: this.revision, stats };
+    return stats;
+  }
+
+  /**
+   * Revision counter - changes whenever documents are added or deleted
+   */
+  getRevision(): number {
+    return this.revision;
+  }
+
+  /**
+   * Shared (cached) embeddings model, for components that embed queries themselves
+   */
+  getEmbeddings(): CachedEmbeddings {
+    return this.embeddings;
   }
 
   /**
@@ -274,6 +423,8 @@ export class VectorSearchService {
     }
 
     this.documents.clear();
+    this.records.clear();
+    this.revision++;
     this.isCleanedUp = true;
   }
 }
@@ -1,6 +1,7 @@
 import { OpenAIEmbeddings } from '@langchain/openai';
 import { MemoryVectorStore } from 'langchain/vectorstores/memory';
 import { Document } from 'langchain/document';
+import { embeddingConfig } from '../config/embedding.config';
 
 export interface SearchResult {
   content: string;
@@ -23,6 +24,8 @@ export class VectorSearchService {
       openAIApiKey: process.env.OPENAI_API_KEY,
       timeout: 30000,
       maxRetries: 3,
+      batchSize: embeddingConfig.batchSize,
+      maxConcurrency: embeddingConfig.maxConcurrency,
     });
 
     // Initialize in-memory vector store
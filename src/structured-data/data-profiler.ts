@@ -21,6 +21,21 @@ const DEFAULT_OPTIONS: ProfilerOptions = {
   detectTemporal: true,
 };
 
+const FNV_OFFSET_BASIS = 0x811c9dc5;
+const FNV_PRIME = 0x01000193;
+
+/**
+ * Fold a cell value into a 32-bit FNV-1a row hash (type-tagged so 1 and '1' differ)
+ */
+function hashCell(hash: number, value: unknown): number {
+  const str = (typeof value === 'string' ? 's' : 'v') + String(value);
+  for (let i = 0; i < str.length; i++) {
+    hash = Math.imul(hash ^ str.charCodeAt(i), FNV_PRIME);
+  }
+  // Column separator so ['ab', 'c'] and ['a', 'bc'] hash differently
+  return Math.imul(hash ^ 0x1f, FNV_PRIME);
+}
+
 export class DataProfiler {
   private options: ProfilerOptions;
 
@@ -67,7 +82,7 @@ export class DataProfiler {
     const dataQuality = this.calculateDataQuality(data, numericProfiles, categoricalProfiles);
 
     // Calculate correlations between numeric columns
-    const correlations = this.calculateCorrelations(data.rows, Array.from(numericProfiles.keys()));
+    const correlations = this.calculateCorrelations(data.rows, data.numericColumns);
 
     // Generate insights, anomalies, and gaps
     const insights = this.generateInsights(numericProfiles, categoricalProfiles, temporalProfiles);
@@ -97,15 +112,36 @@ export class DataProfiler {
    * Profile a numeric column
    */
   private profileNumericColumn(rows: any[], header: string, type: string): NumericProfile {
-    const values = rows
-      .map(row => row[header])
-      .filter(v => v !== null && v !== undefined && v !== '')
-      .map(v => Number(v));
+    // Single pass: collect non-missing values into a typed array and accumulate
+    // min/max/mean/variance (Welford) without intermediate arrays or spread calls
+    const values = new Float64Array(rows.length);
+    const rowIndices = new Int32Array(rows.length);
+    let count = 0;
+    let mean = 0;
+    let m2 = 0;
+    let min = Infinity;
+    let max = -Infinity;
+
+    for (let i = 0; i < rows.length; i++) {
+      const raw = rows[i][header];
+      if (raw === null || raw === undefined || raw === '') continue;
+
+      const v = Number(raw);
+      values[count] = v;
+      rowIndices[count] = i;
+      count++;
+
+      const delta = v - mean;
+      mean += delta / count;
+      m2 += delta * (v - mean);
+      if (v < min) min = v;
+      if (v > max) max = v;
+    }
 
-    const missingCount = rows.length - values.length;
+    const missingCount = rows.length - count;
     const missingPercent = (missingCount / rows.length) * 100;
 
-    if (values.length === 0) {
+    if (count === 0) {
       return {
         columnName: header,
         count: 0,
@@ -122,31 +158,30 @@ export class DataProfiler {
       };
     }
 
-    // Sort for percentile calculations
-    const sorted = [...values].sort((a, b) => a - b);
+    const stdDev = Math.sqrt(m2 / count);
 
-    // Calculate statistics
-    const mean = values.reduce((sum, v) => sum + v, 0) / values.length;
+    // Sort for percentile calculations (typed-array sort is numeric, no comparator needed)
+    const sorted = values.slice(0, count).sort();
     const median = this.calculatePercentile(sorted, 50);
-    const variance = values.reduce((sum, v) => sum + Math.pow(v - mean, 2), 0) / values.length;
-    const stdDev = Math.sqrt(variance);
 
     // Detect outliers (values > threshold * stdDev from mean)
     const outlierThreshold = this.options.outlierThreshold || 3;
-    const outliers = rows
-      .map((row, idx) => ({ value: Number(row[header]), rowIndex: idx }))
-      .filter(
-        item => !isNaN(item.value) && Math.abs(item.value - mean) > outlierThreshold * stdDev
-      );
+    const outliers: Array<{ value: number; rowIndex: number }> = [];
+    for (let i = 0; i < count; i++) {
+      const v = values[i];
+      if (!isNaN(v) && Math.abs(v - mean) > outlierThreshold * stdDev) {
+        outliers.push({ value: v, rowIndex: rowIndices[i] });
+      }
+    }
 
     return {
       columnName: header,
-      count: values.length,
+      count,
       mean,
       median,
       stdDev,
-      min: Math.min(...values),
-      max: Math.max(...values),
+      min,
+      max,
       percentile25: this.calculatePercentile(sorted, 25),
       percentile75: this.calculatePercentile(sorted, 75),
       missingCount,
@@ -372,7 +407,7 @@ export class DataProfiler {
   /**
    * Calculate percentile
    */
-  private calculatePercentile(sortedValues: number[], percentile: number): number {
+  private calculatePercentile(sortedValues: ArrayLike<number>, percentile: number): number {
     const index = (percentile / 100) * (sortedValues.length - 1);
     const lower = Math.floor(index);
     const upper = Math.ceil(index);
@@ -409,19 +444,35 @@ export class DataProfiler {
       totalMissingValues += profile.missingCount;
     }
 
-    // Calculate complete rows (rows with no missing values)
+    // Single pass over the rows: count complete rows (no missing values) and hash
+    // each row for duplicate detection at the same time. Rows are bucketed by a
+    // 32-bit FNV-1a hash (no per-row key strings), and rows sharing a hash are
+    // compared cell by cell so hash collisions are never counted as duplicates.
+    const headers = data.headers;
+    const rows = data.rows;
+    const buckets = new Map<number, number[]>();
     let completeRows = 0;
-    for (const row of data.rows) {
-      const isComplete = data.headers.every(
-        header => row[header] !== null && row[header] !== undefined && row[header] !== ''
-      );
+    let duplicateRows = 0;
+    for (let r = 0; r < rows.length; r++) {
+      const row = rows[r];
+      let isComplete = true;
+      let hash = FNV_OFFSET_BASIS;
+      for (let h = 0; h < headers.length; h++) {
+        const value = row[headers[h]];
+        if (value === null || value === undefined || value === '') isComplete = false;
+        hash = hashCell(hash, value);
+      }
       if (isComplete) completeRows++;
-    }
 
-    // Detect duplicate rows
-    const rowStrings = data.rows.map(row => JSON.stringify(row));
-    const uniqueRows = new Set(rowStrings);
-    const duplicateRows = rowStrings.length - uniqueRows.size;
+      const bucket = buckets.get(hash);
+      if (!bucket) {
+        buckets.set(hash, [r]);
+      } else if (bucket.some(other => this.rowsEqual(rows[other], row, headers))) {
+        duplicateRows++;
+      } else {
+        bucket.push(r);
+      }
+    }
 
     const completeness = (completeRows / data.rowCount) * 100;
 
@@ -436,6 +487,16 @@ export class DataProfiler {
     };
   }
 
+  /**
+   * Cell-by-cell row comparison (used to confirm hash matches)
+   */
+  private rowsEqual(a: any, b: any, headers: string[]): boolean {
+    for (const header of headers) {
+      if (!Object.is(a[header], b[header])) return false;
+    }
+    return true;
+  }
+
   /**
    * Calculate correlations between numeric columns
    */
@@ -444,13 +505,17 @@ export class DataProfiler {
 
     if (numericColumns.length < 2) return correlations;
 
+    // Extract each column once into a contiguous typed array (NaN = missing)
+    // instead of re-reading and re-boxing the rows for every pair
+    const columns = numericColumns.map(column => this.extractNumericColumn(rows, column));
+
     // Calculate correlation for each pair
     for (let i = 0; i < numericColumns.length; i++) {
       for (let j = i + 1; j < numericColumns.length; j++) {
         const col1 = numericColumns[i];
         const col2 = numericColumns[j];
 
-        const correlation = this.calculatePearsonCorrelation(rows, col1, col2);
+        const correlation = this.calculatePearsonCorrelation(columns[i], columns[j]);
 
         if (Math.abs(correlation) >= (this.options.minCorrelation || 0.5)) {
           correlations.push({
@@ -467,24 +532,41 @@ export class DataProfiler {
   }
 
   /**
-   * Calculate Pearson correlation coefficient
+   * Read a column as numbers, with missing or non-numeric cells as NaN
    */
-  private calculatePearsonCorrelation(rows: any[], col1: string, col2: string): number {
-    const pairs = rows
-      .map(row => ({
-        x: Number(row[col1]),
-        y: Number(row[col2]),
-      }))
-      .filter(pair => !isNaN(pair.x) && !isNaN(pair.y));
+  private extractNumericColumn(rows: any[], header: string): Float64Array {
+    const values = new Float64Array(rows.length);
+    for (let i = 0; i < rows.length; i++) {
+      const raw = rows[i][header];
+      values[i] = raw === null || raw === undefined || raw === '' ? NaN : Number(raw);
+    }
+    return values;
+  }
 
-    if (pairs.length < 2) return 0;
+  /**
+   * Calculate Pearson correlation coefficient over rows where both values are present
+   */
+  private calculatePearsonCorrelation(xs: Float64Array, ys: Float64Array): number {
+    // Single pass accumulating all five sums
+    let n = 0;
+    let sumX = 0;
+    let sumY = 0;
+    let sumXY = 0;
+    let sumX2 = 0;
+    let sumY2 = 0;
+    for (let i = 0; i < xs.length; i++) {
+      const x = xs[i];
+      const y = ys[i];
+      if (isNaN(x) || isNaN(y)) continue;
+      n++;
+      sumX += x;
+      sumY += y;
+      sumXY += x * y;
+      sumX2 += x * x;
+      sumY2 += y * y;
+    }
 
-    const n = pairs.length;
-    const sumX = pairs.reduce((sum, p) => sum + p.x, 0);
-    const sumY = pairs.reduce((sum, p) => sum + p.y, 0);
-    const sumXY = pairs.reduce((sum, p) => sum + p.x * p.y, 0);
-    const sumX2 = pairs.reduce((sum, p) => sum + p.x * p.x, 0);
-    const sumY2 = pairs.reduce((sum, p) => sum + p.y * p.y, 0);
+    if (n < 2) return 0;
 
     const numerator = n * sumXY - sumX * sumY;
     const denominator = Math.sqrt((n * sumX2 - sumX * sumX) * (n * sumY2 - sumY * sumY));
@@ -168,7 +168,7 @@ interface TableInfo {
   rowCount: number;
 }
 
-function sanitizeTableName(filename: string): string {
+export function sanitizeTableName(filename: string): string {
   // Remove file extension
   let name = filename.replace(/\.(csv|xlsx|xls)$/i, '');
 
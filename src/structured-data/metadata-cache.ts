@@ -0,0 +1,105 @@
+/**
+ * Metadata Cache - persists generated dataset metadata across restarts
+ * Keyed by filename + size + content hash, so unchanged CSVs skip profiling
+ * and the LLM description call entirely on reload. Only the latest entry per
+ * filename is kept, so re-uploading a changed file replaces its old metadata.
+ */
+
+import * as crypto from 'crypto';
+import * as fs from 'fs/promises';
+import * as path from 'path';
+import type { EnhancedMetadata } from './metadata-generator.js';
+
+export class MetadataCache {
+  private entries: Map<string, EnhancedMetadata> = new Map();
+  private dirty: boolean = false;
+
+  constructor(
+    private cachePath: string = process.env.METADATA_CACHE_PATH || './data/metadata_cache.json'
+  ) {}
+
+  /**
+   * Cache key for a file's content
+   */
+  static key(filename: string, content: string): string {
+    const hash = crypto.createHash('sha256').update(content).digest('hex');
+    return `${filename}:${Buffer.byteLength(content)}:${hash}`;
+  }
+
+  get(key: string): EnhancedMetadata | undefined {
+    return this.entries.get(key);
+  }
+
+  set(key: string, metadata: EnhancedMetadata): void {
+    this.replace(key, metadata);
+    this.dirty = true;
+  }
+
+  /**
+   * Store an entry, dropping any older revision of the same file
+   */
+  private replace(key: string, metadata: EnhancedMetadata): boolean {
+    const filename = filenameOf(key);
+    let replaced = false;
+    for (const existing of this.entries.keys()) {
+      if (existing !== key && filenameOf(existing) === filename) {
+        this.entries.delete(existing);
+        replaced = true;
+      }
+    }
+    this.entries.set(key, metadata);
+    return replaced;
+  }
+
+  async load(): Promise<void> {
+    try {
+      const data = await fs.readFile(this.cachePath, 'utf-8');
+      const cached: Record<string, EnhancedMetadata> = JSON.parse(data, reviveMaps);
+
+      for (const [key, metadata] of Object.entries(cached)) {
+        metadata.profile.profiledAt = new Date(metadata.profile.profiledAt);
+        // Caches written before per-file replacement may hold several revisions
+        if (this.replace(key, metadata)) {
+          this.dirty = true;
+        }
+      }
+
+      console.log(`   📋 Loaded ${this.entries.size} cached dataset metadata entries`);
+    } catch {
+      // No cache yet (or unreadable) - start empty
+    }
+  }
+
+  async save(): Promise<void> {
+    if (!this.dirty) {
+      return;
+    }
+
+    try {
+      await fs.mkdir(path.dirname(this.cachePath), { recursive: true });
+      await fs.writeFile(
+        this.cachePath,
+        JSON.stringify(Object.fromEntries(this.entries), serializeMaps)
+      );
+      this.dirty = false;
+      console.log(`   💾 Saved ${this.entries.size} dataset metadata entries to cache`);
+    } catch (error) {
+      console.error('   ⚠️  Failed to save metadata cache:', error);
+    }
+  }
+}
+
+// Keys are `${filename}:${size}:${hash}` - filenames may themselves contain ':'
+function filenameOf(key: string): string {
+  const hashStart = key.lastIndexOf(':');
+  return key.slice(0, key.lastIndexOf(':', hashStart - 1));
+}
+
+// Profiles contain Maps, which JSON.stringify would otherwise drop to {}
+function serializeMaps(_key: string, value: any): any {
+  return value instanceof Map ? { __map: Array.from(value.entries()) } : value;
+}
+
+function reviveMaps(_key: string, value: any): any {
+  return value && Array.isArray(value.__map) ? new Map(value.__map) : value;
+}
@@ -68,6 +68,34 @@ export class MetadataGenerator {
     return enhanced.basicDescription;
   }
 
+  /**
+   * Summarize a column from its already-computed profile (same wording as analyzeColumn)
+   * Returns null for columns without a numeric/categorical profile, e.g. temporal ones
+   */
+  private summarizeFromProfile(
+    profile: DatasetProfile,
+    header: string,
+    rowCount: number
+  ): string | null {
+    if (rowCount === 0) return null;
+
+    const numeric = profile.numericProfiles.get(header);
+    if (numeric) {
+      return numeric.count === 0 ? 'All NULL' : `range ${numeric.min} - ${numeric.max}`;
+    }
+
+    const categorical = profile.categoricalProfiles.get(header);
+    if (categorical) {
+      if (categorical.totalCount === 0) return 'All NULL';
+      if (categorical.uniqueCount <= 5) {
+        return `values: ${Array.from(categorical.distribution.keys()).join(', ')}`;
+      }
+      return `${categorical.uniqueCount} unique values`;
+    }
+
+    return null;
+  }
+
   /**
    * Generate basic semantic description using LLM
    */
@@ -77,9 +105,12 @@ export class MetadataGenerator {
     profile: DatasetProfile
   ): Promise<string> {
     // Build schema description
+    const numericColumns = new Set(data.numericColumns);
     const schemaDescription = data.headers
       .map((header, i) => {
-        const columnAnalysis = analyzeColumn(data.rows, header);
+        const columnAnalysis =
+          this.summarizeFromProfile(profile, header, data.rowCount) ??
+          analyzeColumn(data.rows, header, numericColumns.has(header));
         return `- ${header} (${data.types[i]}): ${columnAnalysis}`;
       })
       .join('\n');
@@ -7,6 +7,7 @@ export interface ParsedData {
   rowCount: number;
   columnCount: number;
   types: string[];
+  numericColumns: string[]; // headers inferred as INTEGER/REAL, computed once at parse time
   sampleRows: any[];
 }
 
@@ -23,6 +24,9 @@ export async function parseCSV(content: string, filename: string): Promise<Parse
 
           // Infer types from data
           const types = inferTypes(rows, headers);
+          const numericColumns = headers.filter(
+            (_, i) => types[i] === 'INTEGER' || types[i] === 'REAL'
+          );
 
           // Get sample rows (first 5 + last 5)
           const sampleRows = [
@@ -37,6 +41,7 @@ export async function parseCSV(content: string, filename: string): Promise<Parse
             rowCount: rows.length,
             columnCount: headers.length,
             types,
+            numericColumns,
             sampleRows,
           });
         } catch (error) {
@@ -101,7 +106,11 @@ function inferTypes(rows: any[], headers: string[]): string[] {
   });
 }
 
-export function analyzeColumn(rows: any[], header: string): string {
+/**
+ * Summarize a column for LLM prompts
+ * Pass isNumeric (from ParsedData.numericColumns) to skip re-detecting the column type
+ */
+export function analyzeColumn(rows: any[], header: string, isNumeric?: boolean): string {
   if (rows.length === 0) {
     return 'No data';
   }
@@ -114,17 +123,23 @@ export function analyzeColumn(rows: any[], header: string): string {
     return 'All NULL';
   }
 
-  // Get unique values
-  const uniqueValues = [...new Set(values)];
-
   // If numeric, show range
-  if (values.every(v => !isNaN(Number(v)))) {
-    const numbers = values.map(v => Number(v));
-    const min = Math.min(...numbers);
-    const max = Math.max(...numbers);
-    return `range ${min} - ${max}`;
+  if (isNumeric ?? values.every(v => !isNaN(Number(v)))) {
+    let min = Infinity;
+    let max = -Infinity;
+    for (const v of values) {
+      const num = Number(v);
+      if (num < min) min = num;
+      if (num > max) max = num;
+    }
+    if (min <= max) {
+      return `range ${min} - ${max}`;
+    }
   }
 
+  // Get unique values
+  const uniqueValues = [...new Set(values)];
+
   // If categorical with few unique values, list them
   if (uniqueValues.length <= 5) {
     return `values: ${uniqueValues.join(', ')}`;
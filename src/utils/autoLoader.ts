@@ -4,11 +4,14 @@
  * With persistence support: skips already-processed files
  */
 
+import type { Dirent } from 'fs';
 import * as fs from 'fs/promises';
+import * as os from 'os';
 import * as path from 'path';
 import type { DataProcessor } from '../services/dataProcessor';
 import type { DocumentParser } from '../services/documentParser';
 import { FileTracker } from '../services/fileTracker';
+import { mapWithConcurrency } from './concurrency';
 import type { Database } from 'duckdb-async';
 
 export class AutoLoader {
@@ -82,17 +85,16 @@ export class AutoLoader {
 
       console.log(`\n📂 Auto-loading demo data from: ${fullPath}`);
 
-      // Check if directory exists
+      // Read the directory once with file types (no separate existence check or per-file stat)
+      let entries: Dirent[];
       try {
-        await fs.access(fullPath);
+        entries = await fs.readdir(fullPath, { withFileTypes: true });
       } catch {
         console.log(`⚠️  Directory not found: ${fullPath}`);
         console.log(`   Skipping auto-load. To enable, create the directory and add files.`);
         return;
       }
-
-      // Read all files in directory
-      const files = await fs.readdir(fullPath);
+      const files = entries.map(entry => entry.name);
 
       if (files.length === 0) {
         console.log(`📭 No files found in ${directoryPath}`);
@@ -105,22 +107,35 @@ export class AutoLoader {
       let processedCount = 0;
       let skippedCount = 0;
 
-      // Process each file
-      for (const filename of files) {
+      // Process files with bounded concurrency - parsing, DuckDB inserts and
+      // embedding/LLM calls for one file overlap with I/O waits of the others
+      const defaultConcurrency = Math.min(os.cpus().length, 8);
+      const concurrency = Math.max(
+        1,
+        parseInt(process.env.AUTO_LOAD_CONCURRENCY || String(defaultConcurrency)) ||
+          defaultConcurrency
+      );
+      console.log(`⚡ Loading with concurrency ${concurrency}`);
+
+      await mapWithConcurrency(entries, concurrency, async entry => {
+        const filename = entry.name;
+
         // Skip hidden files and directories
         if (filename.startsWith('.')) {
           skippedCount++;
-          continue;
+          return;
         }
 
         const filePath = path.join(fullPath, filename);
 
         try {
-          // Check if it's a file (not directory)
-          const stats = await fs.stat(filePath);
-          if (!stats.isFile()) {
+          // Check if it's a file (not directory) - only symlinks need a stat to resolve
+          const isFile = entry.isSymbolicLink()
+            ? (await fs.stat(filePath)).isFile()
+            : entry.isFile();
+          if (!isFile) {
             skippedCount++;
-            continue;
+            return;
           }
 
           // Check if file needs processing (if file tracker is enabled)
@@ -128,7 +143,7 @@ export class AutoLoader {
             const needsProcessing = await this.fileTracker.needsProcessing(filePath);
             if (!needsProcessing) {
               skippedCount++;
-              continue; // Skip this file
+              return; // Skip this file
             }
 
             // Mark as processing
@@ -186,7 +201,7 @@ export class AutoLoader {
           }
           console.error(`  ❌ Failed to load ${filename}:`, error.message);
         }
-      }
+      });
 
       console.log(
         `\n📊 Auto-load complete: ${processedCount} processed, ${skippedCount} skipped`
@@ -200,6 +215,7 @@ export class AutoLoader {
           await vectorSearch.saveCacheNow();
           console.log('✅ Vector cache saved\n');
         }
+        await this.dataProcessor.saveMetadataCache();
       }
     } catch (error: any) {
       console.error('❌ Auto-load failed:', error.message);
@@ -0,0 +1,25 @@
+/**
+ * Map over items with at most `limit` promises in flight
+ * Results keep input order; the first rejection rejects the whole call
+ */
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results: R[] = new Array(items.length);
+  let next = 0;
+
+  const worker = async (): Promise<void> => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  // A NaN or non-positive limit would otherwise start zero workers and silently do nothing
+  const safeLimit = Number.isFinite(limit) && limit >= 1 ? Math.floor(limit) : 1;
+  const workers = Array.from({ length: Math.max(1, Math.min(safeLimit, items.length)) }, worker);
+  await Promise.all(workers);
+  return results;
+}
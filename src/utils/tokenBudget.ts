@@ -0,0 +1,44 @@
+/**
+ * Token budgeting for LLM prompts
+ * Counts tokens with the cl100k_base encoding used by GPT-4-class models
+ */
+
+import { getEncoding, Tiktoken } from 'js-tiktoken';
+
+let encoder: Tiktoken | null = null;
+
+// Loading the BPE ranks is costly - create the encoder once, on first use
+function getEncoder(): Tiktoken {
+  if (!encoder) {
+    encoder = getEncoding('cl100k_base');
+  }
+  return encoder;
+}
+
+export function countTokens(text: string): number {
+  return getEncoder().encode(text).length;
+}
+
+/**
+ * Greedily keep sections (assumed ordered by relevance) while they fit within the budget
+ * If even the first section is too large, it is truncated to the budget so context is never empty
+ */
+export function fitToTokenBudget(sections: string[], maxTokens: number): string[] {
+  const kept: string[] = [];
+  let used = 0;
+
+  for (const section of sections) {
+    const tokens = countTokens(section);
+    if (used + tokens > maxTokens) {
+      if (kept.length === 0) {
+        const enc = getEncoder();
+        kept.push(enc.decode(enc.encode(section).slice(0, maxTokens)));
+      }
+      break;
+    }
+    kept.push(section);
+    used += tokens;
+  }
+
+  return kept;
+}